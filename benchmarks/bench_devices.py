@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Benchmark device lookups on large synthetic netlists.
+
+Compares the dictionary-indexed Devices registry with the original linear
+scan of devices_list, for building and executing a netlist of n gates.
+
+Usage
+-----
+python benchmarks/bench_devices.py [n ...]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from final.names import Names  # noqa: E402
+from final.devices import Devices  # noqa: E402
+from final.network import Network  # noqa: E402
+
+
+class LinearDevices(Devices):
+    """Devices with the original list-scanning lookups, for comparison."""
+
+    def get_device(self, device_id):
+        """Return the Device object corresponding to device_id."""
+        for device in self.devices_list:
+            if device.device_id == device_id:
+                return device
+        return None
+
+    def find_devices(self, device_kind=None):
+        """Return a list of device IDs of the specified device_kind."""
+        device_id_list = []
+        for device in self.devices_list:
+            if device_kind is None:
+                device_id_list.append(device.device_id)
+            elif device.device_kind == device_kind:
+                device_id_list.append(device.device_id)
+        return device_id_list
+
+
+def build_netlist(devices_class, gates):
+    """Build a netlist of two-input NAND gates fed from two switches.
+
+    Each gate is driven by the previous gate and one of the switches, so the
+    network is a long combinational chain.
+    """
+    names = Names()
+    devices = devices_class(names)
+    network = Network(names, devices)
+    [I1, I2] = names.lookup(["I1", "I2"])
+    devices.make_device("SW_A", devices.SWITCH, 0)
+    devices.make_device("SW_B", devices.SWITCH, 1)
+    previous = "SW_A"
+    for i in range(gates):
+        gate_id = "G" + str(i)
+        devices.make_device(gate_id, devices.NAND, 2)
+        network.make_connection(previous, None, gate_id, I1)
+        network.make_connection("SW_B", None, gate_id, I2)
+        previous = gate_id
+    return devices, network
+
+
+def time_run(devices_class, gates):
+    """Return (build seconds, seconds per execute_network cycle)."""
+    start = time.perf_counter()
+    devices, network = build_netlist(devices_class, gates)
+    built = time.perf_counter()
+    network.execute_network()
+    executed = time.perf_counter()
+    return built - start, executed - built
+
+
+def main(arg_list):
+    """Time both registries for each netlist size in arg_list."""
+    sizes = [int(arg) for arg in arg_list] or [10000, 100000]
+    for gates in sizes:
+        build, cycle = time_run(Devices, gates)
+        print("".join(["indexed ", str(gates), " gates: build ",
+                       "%.3f" % build, " s, cycle ", "%.3f" % cycle, " s"]))
+        # The linear registry is quadratic, so only time it on a sample of
+        # the netlist and extrapolate beyond that
+        sample = min(gates, 2000)
+        build, cycle = time_run(LinearDevices, sample)
+        scale = (gates / sample) ** 2
+        print("".join(["linear  ", str(sample), " gates: build ",
+                       "%.3f" % build, " s, cycle ", "%.3f" % cycle,
+                       " s (x", "%.0f" % scale, " expected at ", str(gates),
+                       " gates)"]))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
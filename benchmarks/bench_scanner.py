@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark the scanner on large synthetic definition files.
+
+Compares the regex tokenizer of the Scanner with its character loops, and
+with the original scanner, which sliced the list of characters left in the
+file after every character, for scanning a definition file of n gates up to
+its END keyword.
+
+Usage
+-----
+python benchmarks/bench_scanner.py [n ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from final.names import Names  # noqa: E402
+from final.scanner import Scanner  # noqa: E402
+
+
+class ListScanner(Scanner):
+    """Scanner with the original list-slicing reads, for comparison."""
+
+    def __init__(self, path, names):
+        """Open the file and keep its contents as a list of characters."""
+        super().__init__(path, names, fast=False)
+        characters = []
+        while self._read_chunk():
+            characters.extend(self.contents)
+            self.position = len(self.contents)
+        self.contents = characters
+        self._advance()
+
+    def _advance(self):
+        """Advance to the next character in the file contents."""
+        if self.pushed_back:
+            self.current_character = self.pushed_back.pop()
+            return
+        try:
+            self.current_character = self.contents[0]
+            self.contents = self.contents[1:]
+        except IndexError:
+            self.current_character = ""
+
+    def _at_end(self):
+        """Return True if no characters are left after the current one."""
+        return not self.pushed_back and len(self.contents) == 0
+
+
+def write_definition(definition_file, gates):
+    """Write a definition file of two-input NAND gates fed from two switches.
+
+    Each gate is driven by the previous gate and one of the switches, and
+    the last gate is monitored.
+    """
+    lines = ["DEVICES", "SW_A = SWITCH / 0,", "SW_B = SWITCH / 1,"]
+    lines.extend(["G" + str(i) + " = NAND / 2," for i in range(gates - 1)])
+    lines.extend(["G" + str(gates - 1) + " = NAND / 2", "", "CONNECTIONS"])
+    previous = "SW_A"
+    for i in range(gates):
+        gate_id = "G" + str(i)
+        lines.append("W" + str(2 * i) + " = " + previous + " > " + gate_id
+                     + "-I1,")
+        lines.append("W" + str(2 * i + 1) + " = SW_B > " + gate_id + "-I2,")
+        previous = gate_id
+    lines[-1] = lines[-1].rstrip(",")
+    lines.extend(["", "MONITORS", "M1 = " + previous, "", "END", ""])
+    definition_file.write("\n".join(lines))
+
+
+def time_scan(scanner_class, gates, fast=False):
+    """Return (file size in bytes, seconds to scan the file)."""
+    with tempfile.NamedTemporaryFile("w", suffix=".txt",
+                                     delete=False) as definition_file:
+        write_definition(definition_file, gates)
+    try:
+        size = os.path.getsize(definition_file.name)
+        start = time.perf_counter()
+        if scanner_class is ListScanner:
+            scanner = ListScanner(definition_file.name, Names())
+        else:
+            scanner = scanner_class(definition_file.name, Names(), fast)
+        # Scan up to the END keyword, where the parser stops
+        symbol = scanner.get_symbol()
+        while not (symbol.type == scanner.KEYWORD
+                   and symbol.id == scanner.END_ID):
+            symbol = scanner.get_symbol()
+        return size, time.perf_counter() - start
+    finally:
+        os.remove(definition_file.name)
+
+
+def main(arg_list):
+    """Time the scanners for each definition file size in arg_list."""
+    sizes = [int(arg) for arg in arg_list] or [10000, 100000]
+    for gates in sizes:
+        size, seconds = time_scan(Scanner, gates, fast=True)
+        print("".join(["regex  ", str(gates), " gates (", str(size),
+                       " bytes): ", "%.3f" % seconds, " s"]))
+        size, seconds = time_scan(Scanner, gates)
+        print("".join(["loops  ", str(gates), " gates (", str(size),
+                       " bytes): ", "%.3f" % seconds, " s"]))
+        # The list scanner is quadratic, so only time it on a sample of the
+        # file and extrapolate beyond that
+        sample = min(gates, 1000)
+        sample_size, seconds = time_scan(ListScanner, sample)
+        scale = (size / sample_size) ** 2
+        print("".join(["list   ", str(sample), " gates (", str(sample_size),
+                       " bytes): ", "%.3f" % seconds, " s (x", "%.0f" % scale,
+                       " expected at ", str(gates), " gates)"]))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
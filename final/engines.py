@@ -0,0 +1,36 @@
+"""Select the simulation engine used to execute the network.
+
+Used in the Logic Simulator project by the command line and graphical user
+interfaces to choose how Network.execute_network runs.
+
+Functions
+---------
+set_engine - sets the simulation engine of the network.
+"""
+from vector import VectorEngine
+
+# Names of the simulation engines, as given to logsim.py -e
+ENGINES = ["iterative", "levelized", "event", "vector"]
+
+
+def set_engine(engine_name, names, devices, network):
+    """Set the simulation engine of the network to engine_name.
+
+    Return True if successful, or False if the engine name is unknown or the
+    engine is not available.
+    """
+    if engine_name == "iterative":
+        network.engine = network.ITERATIVE
+    elif engine_name == "levelized":
+        network.engine = network.LEVELIZED
+    elif engine_name == "event":
+        network.engine = network.EVENT_DRIVEN
+    elif engine_name == "vector":
+        try:
+            network.engine = VectorEngine(names, devices, network)
+        except ImportError as error:
+            print("Error: " + str(error))
+            return False
+    else:
+        return False
+    return True
@@ -10,6 +10,7 @@ from network import Network
 from monitors import Monitors
 from scanner import Scanner
 from parse import Parser
+from engines import set_engine
 import sys
 
 
@@ -137,22 +138,33 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         # If sim has been run, draw trace
         colours = self.parent.generate_colours(
                 len(self.monitors_dictionary))
+        # Cycles on the screen, so that only those are read from the traces
+        first_visible = max(0, int(
+            (-self.pan_x / self.zoom_x - self.BORDER_X) // self.DX))
+        last_visible = int(((self.size.width - self.pan_x) / self.zoom_x
+                            - self.BORDER_X) // self.DX) + 1
         if self.monitors_dictionary:
             for i, item in enumerate(self.monitors_dictionary.items()):
-                sig_list = item[1]
+                # Only the most recent cycles may have been kept
+                first_cycle = self.parent.monitors.get_first_cycle(*item[0])
+                start = max(0, first_visible - first_cycle)
+                stop = max(start, last_visible + 1 - first_cycle)
+                sig_runs = self.parent.monitors.get_runs(*item[0], start, stop)
 
                 y_MID = TOP - (self.LINE_HEIGHT * i) - BORDER_Y
                 y_HIGH = y_MID + DY
                 y_LOW = y_MID - DY
 
-                # Draw signal
+                # Draw signal, one line for each run of equal signals
                 [r, g, b] = colours[i]
                 GL.glColor3f(r, g, b)
                 GL.glLineWidth(10)
                 GL.glBegin(GL.GL_LINE_STRIP)
-                for j, sig in enumerate(sig_list):
+                j = first_cycle + start
+                for sig, length in sig_runs:
                     x = (j * self.DX) + self.BORDER_X
-                    x_next = (j * self.DX) + self.BORDER_X + self.DX
+                    x_next = x + length * self.DX
+                    j += length
                     if sig == self.devices.HIGH:
                         y = y_HIGH
                         y_next = y_HIGH
@@ -169,7 +181,6 @@ class MyGLCanvas(wxcanvas.GLCanvas):
                         continue
                     GL.glVertex2f(x, y)
                     GL.glVertex2f(x_next, y_next)
-                    j += 1
                 GL.glEnd()
                 GL.glLineWidth(1)
 
@@ -331,10 +342,14 @@ class Gui(wx.Frame):
     enables the user to change the circuit properties and run simulations.
     """
 
-    def __init__(self, title, path) -> None:
+    def __init__(self, title, path, engine="iterative", history=None,
+                 trace_directory=None) -> None:
         """Initialise static widgets and layout."""
         super().__init__(parent=None, title=title, size=(400, 400))
         self.path = None
+        self.engine = engine  # name of the simulation engine
+        self.history = history  # number of cycles kept in the traces
+        self.trace_directory = trace_directory  # directory of mapped traces
         self.names = None
         self.devices = None
         self.network = None
@@ -681,7 +696,9 @@ class Gui(wx.Frame):
         self.names = Names()
         self.devices = Devices(self.names)
         self.network = Network(self.names, self.devices)
-        self.monitors = Monitors(self.names, self.devices, self.network)
+        self.monitors = Monitors(self.names, self.devices, self.network,
+                                 history=self.history,
+                                 trace_directory=self.trace_directory)
 
         # Interpret file
         scanner = Scanner(self.path, self.names)
@@ -690,6 +707,10 @@ class Gui(wx.Frame):
         if not parser.parse_network():
             print(_(u"Error! Unable to parse file."))
             return
+        if not set_engine(self.engine, self.names, self.devices,
+                          self.network):
+            print(_(u"Error! Unable to set the simulation engine."))
+            return
 
         # Add switches
         self.switches_rows_sizer.Clear(True)
@@ -700,8 +721,7 @@ class Gui(wx.Frame):
             self._add_switch(switch_id, switch_state)
 
         # Clear any existing traces
-        for monitor in self.monitors.monitors_dictionary:
-            self.monitors.monitors_dictionary[monitor] = []
+        self.monitors.reset_monitors()
         self.canvas.monitors_dictionary = self.monitors.monitors_dictionary
 
         self._update_monitor_list()
@@ -762,8 +782,7 @@ class Gui(wx.Frame):
                 self.has_started = True
         elif Id == self.CLEAR_ID:
             if self.has_started and not self.timer.IsRunning():
-                for monitor in self.monitors.monitors_dictionary:
-                    self.monitors.monitors_dictionary[monitor] = []
+                self.monitors.reset_monitors()
                 self.canvas.monitors_dictionary =\
                     self.monitors.monitors_dictionary
                 self.cycles_completed = 0
@@ -9,6 +9,11 @@ Usage
 Show help: logsim.py -h
 Command line user interface: logsim.py -c <file path>
 Graphical user interface: logsim.py <file path>
+Choose the simulation engine: logsim.py -e <engine> [-c] <file path>
+Sweep the switches: logsim.py -s <cycles> [-n <count>] <file path>
+Keep only the last cycles of the traces: logsim.py -w <cycles> [-c] <file path>
+Write a VCD file: logsim.py -d <cycles> [-o <vcd path>] <file path>
+Store the traces in files: logsim.py -m <directory> [-c] <file path>
 """
 import getopt
 import sys
@@ -25,9 +30,76 @@ from scanner import Scanner
 from parse import Parser
 from userint import UserInterface
 
+from engines import ENGINES, set_engine
+from sweep import Sweep
+from vcd import VcdWriter
+
 from gui import Gui
 
 
+def sweep_switches(path, engine, cycles, count=None):
+    """Simulate switch assignments of the file for the given cycles.
+
+    Every assignment of the switches is simulated, or count random ones if
+    count is given, and the monitor traces of each are displayed.
+    """
+    names = Names()
+    devices = Devices(names)
+    network = Network(names, devices)
+    monitors = Monitors(names, devices, network)
+    scanner = Scanner(path, names)
+    parser = Parser(names, devices, network, monitors, scanner)
+    if not (parser.parse_network()
+            and set_engine(engine, names, devices, network)):
+        return
+
+    sweep = Sweep(names, devices, network, monitors)
+    if count is None:
+        assignments = sweep.exhaustive_assignments()
+    else:
+        assignments = sweep.random_assignments(count)
+    for assignment, traces in sweep.run(assignments, cycles):
+        print(", ".join([switch_id + " = " + str(signal)
+                         for switch_id, signal in assignment.items()]))
+        if traces is None:
+            print("Error: network oscillating")
+            continue
+        monitors.reset_monitors()
+        for monitor, signal_bytes in traces.items():
+            monitors.monitors_dictionary[monitor].extend(signal_bytes)
+        monitors.display_signals()
+
+
+def dump_signals(path, engine, cycles, vcd_path=None):
+    """Run the file for the given cycles and write the traces to a VCD file.
+
+    The VCD file is named after the definition file unless vcd_path is
+    given. Only the latest cycle of each trace is kept in memory.
+    """
+    if vcd_path is None:
+        vcd_path = os.path.splitext(path)[0] + ".vcd"
+    names = Names()
+    devices = Devices(names)
+    network = Network(names, devices)
+    monitors = Monitors(names, devices, network, history=1)
+    scanner = Scanner(path, names)
+    parser = Parser(names, devices, network, monitors, scanner)
+    if not (parser.parse_network()
+            and set_engine(engine, names, devices, network)):
+        return
+
+    with open(vcd_path, "w") as vcd_file:
+        writer = VcdWriter(names, devices, vcd_file)
+        monitors.add_writer(writer)
+        for _ in range(cycles):
+            if not network.execute_network():
+                print("Error: network oscillating")
+                break
+            monitors.record_signals()
+        writer.close()
+    print("Wrote " + str(writer.cycle) + " cycles to " + vcd_path)
+
+
 def main(arg_list):
     """Parse the command line options and arguments specified in arg_list.
 
@@ -37,14 +109,54 @@ def main(arg_list):
     usage_message = ("Usage:\n"
                      "Show help: logsim.py -h\n"
                      "Command line user interface: logsim.py -c <file path>\n"
-                     "Graphical user interface: logsim.py <file path>")
+                     "Graphical user interface: logsim.py <file path>\n"
+                     "Choose the simulation engine: logsim.py -e <engine> "
+                     "[-c] <file path>\n"
+                     "Sweep the switches: logsim.py -s <cycles> "
+                     "[-n <count>] <file path>\n"
+                     "Keep only the last cycles of the traces: "
+                     "logsim.py -w <cycles> [-c] <file path>\n"
+                     "Write a VCD file: logsim.py -d <cycles> "
+                     "[-o <vcd path>] <file path>\n"
+                     "Store the traces in files: logsim.py -m <directory> "
+                     "[-c] <file path>\n"
+                     "Engines: " + ", ".join(ENGINES))
     try:
-        options, arguments = getopt.getopt(arg_list, "hc:")
+        options, arguments = getopt.getopt(arg_list, "hc:e:s:n:w:d:o:m:")
     except getopt.GetoptError:
         print("Error: invalid command line arguments\n")
         print(usage_message)
         sys.exit()
 
+    engine = ENGINES[0]
+    count = None
+    history = None
+    vcd_path = None
+    trace_directory = None
+    for option, value in options:
+        if option == "-e":  # choose the simulation engine
+            if value not in ENGINES:
+                print("Error: unknown engine " + value + "\n")
+                print(usage_message)
+                sys.exit()
+            engine = value
+        elif option in ["-s", "-n", "-w", "-d"] and not value.isdigit():
+            print("Error: " + option + " needs a whole number\n")
+            print(usage_message)
+            sys.exit()
+        elif option == "-n":  # number of random switch assignments
+            count = int(value)
+        elif option == "-w":  # history window of the monitors
+            history = max(1, int(value))
+        elif option == "-o":  # path of the VCD file
+            vcd_path = value
+        elif option == "-m":  # directory of the memory-mapped traces
+            if not os.path.isdir(value):
+                print("Error: " + value + " is not a directory\n")
+                print(usage_message)
+                sys.exit()
+            trace_directory = value
+
     for option, path in options:
         if option == "-h":  # print the usage message
             print(usage_message)
@@ -54,15 +166,31 @@ def main(arg_list):
             names = Names()
             devices = Devices(names)
             network = Network(names, devices)
-            monitors = Monitors(names, devices, network)
+            monitors = Monitors(names, devices, network, history=history,
+                                trace_directory=trace_directory)
             scanner = Scanner(path, names)
             parser = Parser(names, devices, network, monitors, scanner)
-            if parser.parse_network():
+            if (parser.parse_network()
+                    and set_engine(engine, names, devices, network)):
                 # Initialise an instance of the userint.UserInterface() class
                 userint = UserInterface(names, devices, network, monitors)
                 userint.command_interface()
-
-    if not options:  # no option given, use the graphical user interface
+        elif option == "-s":  # sweep the switch assignments
+            if len(arguments) != 1:
+                print("Error: one file path is needed\n")
+                print(usage_message)
+                sys.exit()
+            sweep_switches(arguments[0], engine, int(path), count)
+        elif option == "-d":  # write the traces to a VCD file
+            if len(arguments) != 1:
+                print("Error: one file path is needed\n")
+                print(usage_message)
+                sys.exit()
+            dump_signals(arguments[0], engine, int(path), vcd_path)
+
+    option_names = [option for option, value in options]
+    if not {"-c", "-s", "-d"} & set(option_names):
+        # no -c, -s or -d option given, use the graphical user interface
         if len(arguments) == 1:
             [path] = arguments
         else:
@@ -88,7 +216,8 @@ def main(arg_list):
         locale.AddCatalogLookupPathPrefix('locale')
         locale.AddCatalog('logsim')
 
-        gui = Gui(_("Logic Simulatorinator"), path)
+        gui = Gui(_("Logic Simulatorinator"), path, engine, history,
+                  trace_directory)
         gui.Show(True)
         app.MainLoop()
 
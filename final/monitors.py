@@ -5,10 +5,260 @@ signals.
 
 Classes
 -------
+Trace - base class of the traces that are not stored in plain arrays.
+RunLengthTrace - stores a signal trace as runs of equal signals.
+RingTrace - stores the most recent cycles of a signal trace.
+MappedTrace - stores a signal trace in a memory-mapped file.
 Monitors - records and displays specified output signals.
 
 """
+import array
+import bisect
 import collections
+import itertools
+import mmap
+import tempfile
+
+
+class Trace:
+    """Base class of the signal traces that are not stored in plain arrays.
+
+    Subclasses store the signals in their own way and provide __len__,
+    __iter__ and append(). A trace compares equal to any sequence of the same
+    signals, such as a list or an array.
+
+    Public methods
+    --------------
+    extend(self, signal_list): Adds the signals to the end of the trace.
+    """
+
+    def __eq__(self, other):
+        """Return True if other has the same signals."""
+        try:
+            return (len(self) == len(other)
+                    and all(a == b for a, b in zip(self, other)))
+        except TypeError:
+            return NotImplemented
+
+    def extend(self, signal_list):
+        """Add the signals to the end of the trace."""
+        for signal in signal_list:
+            self.append(signal)
+
+
+class RunLengthTrace(Trace):
+    """Store a signal trace as runs of equal signals.
+
+    Signals that stay constant for long stretches, such as switches and slow
+    clocks, are stored as one (signal, end) pair per run instead of one value
+    per cycle. The trace can be indexed by cycle in O(log n) time by
+    bisecting the run ends, and iterates over one signal per cycle, like a
+    list of signals.
+
+    Parameters
+    ----------
+    signal_list: signals to initialise the trace with.
+
+    Public methods
+    --------------
+    append(self, signal): Adds the signal to the end of the trace.
+
+    extend(self, signal_list): Adds the signals to the end of the trace.
+
+    runs(self): Returns an iterator of the (signal, length) runs of the trace.
+    """
+
+    def __init__(self, signal_list=()):
+        """Initialise the run signals and ends."""
+        self.values = array.array("b")  # signal of each run
+        self.ends = array.array("q")  # cycle after the last cycle of each run
+        self.extend(signal_list)
+
+    def __len__(self):
+        """Return the number of cycles in the trace."""
+        return self.ends[-1] if self.ends else 0
+
+    def __getitem__(self, cycle):
+        """Return the signal at the specified cycle."""
+        if cycle < 0:
+            cycle += len(self)
+        if cycle < 0 or cycle >= len(self):
+            raise IndexError("trace index out of range")
+        return self.values[bisect.bisect_right(self.ends, cycle)]
+
+    def __iter__(self):
+        """Return an iterator of the signal at every cycle."""
+        for signal, length in self.runs():
+            yield from itertools.repeat(signal, length)
+
+    def __eq__(self, other):
+        """Return True if other has the same signal at every cycle."""
+        if isinstance(other, RunLengthTrace):
+            return self.values == other.values and self.ends == other.ends
+        return super().__eq__(other)
+
+    def append(self, signal):
+        """Add the signal to the end of the trace."""
+        if self.values and self.values[-1] == signal:
+            self.ends[-1] += 1
+        else:
+            self.ends.append(len(self) + 1)
+            self.values.append(signal)
+
+    def runs(self):
+        """Return an iterator of the (signal, length) runs of the trace."""
+        start = 0
+        for signal, end in zip(self.values, self.ends):
+            yield (signal, end - start)
+            start = end
+
+
+class RingTrace(Trace):
+    """Store the most recent cycles of a signal trace.
+
+    The signals are written into a fixed-size ring buffer, so only the last
+    history cycles are kept, however long the simulation runs. The trace
+    behaves like a list of the kept signals, oldest first, and first_cycle
+    is the simulation cycle of the oldest one.
+
+    Parameters
+    ----------
+    history: number of cycles to keep.
+    signal_list: signals to initialise the trace with.
+
+    Public methods
+    --------------
+    append(self, signal): Adds the signal to the end of the trace, dropping
+                          the oldest signal if the buffer is full.
+
+    extend(self, signal_list): Adds the signals to the end of the trace.
+    """
+
+    def __init__(self, history, signal_list=()):
+        """Initialise the ring buffer."""
+        self.history = history
+        self.buffer = array.array("b", bytes(history))
+        self.cycles = 0  # number of signals ever added
+        self.first_cycle = 0
+        self.extend(signal_list)
+
+    def __len__(self):
+        """Return the number of cycles kept."""
+        return min(self.cycles, self.history)
+
+    def __getitem__(self, index):
+        """Return the signal at the index into the kept cycles."""
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("trace index out of range")
+        return self.buffer[(self.first_cycle + index) % self.history]
+
+    def __iter__(self):
+        """Return an iterator of the kept signals, oldest first."""
+        if self.cycles <= self.history:
+            return iter(self.buffer[:self.cycles])
+        start = self.cycles % self.history
+        return itertools.chain(self.buffer[start:], self.buffer[:start])
+
+    def append(self, signal):
+        """Add the signal, dropping the oldest if the buffer is full."""
+        self.buffer[self.cycles % self.history] = signal
+        self.cycles += 1
+        self.first_cycle = max(0, self.cycles - self.history)
+
+
+class MappedTrace(Trace):
+    """Store a signal trace in a memory-mapped file.
+
+    The signals are appended to a chunk in memory, and every full chunk is
+    written to the end of a temporary file, so recording uses a bounded
+    amount of memory however long the simulation runs. The written cycles
+    are read through a memory map of the file, so slicing the trace pages in
+    only the cycles in the slice. The file is deleted when the trace is
+    closed or garbage collected.
+
+    Parameters
+    ----------
+    directory: directory of the temporary file, or None for the default.
+    signal_list: signals to initialise the trace with.
+    chunk_size: number of cycles kept in memory before they are written.
+
+    Public methods
+    --------------
+    append(self, signal): Adds the signal to the end of the trace.
+
+    extend(self, signal_list): Adds the signals to the end of the trace.
+
+    close(self): Closes and deletes the file of the trace.
+    """
+
+    def __init__(self, directory=None, signal_list=(), chunk_size=65536):
+        """Open the temporary file and initialise the chunk."""
+        self.trace_file = tempfile.TemporaryFile(dir=directory)
+        self.chunk_size = chunk_size
+        self.chunk = array.array("b")  # cycles not yet written to the file
+        self.stored = 0  # number of cycles written to the file
+        self.mapped = None  # memory map of the written cycles
+        self.extend(signal_list)
+
+    def __len__(self):
+        """Return the number of cycles in the trace."""
+        return self.stored + len(self.chunk)
+
+    def _get_mapped(self):
+        """Return the memory map of the cycles written to the file."""
+        if self.mapped is None:
+            self.mapped = mmap.mmap(self.trace_file.fileno(), self.stored,
+                                    access=mmap.ACCESS_READ)
+        return self.mapped
+
+    def __getitem__(self, index):
+        """Return the signal at the index, or an array for a slice."""
+        if isinstance(index, slice):
+            [start, stop, step] = index.indices(len(self))
+            if step != 1:
+                return array.array("b", [self[cycle] for cycle
+                                         in range(start, stop, step)])
+            signals = array.array("b")
+            if start < min(stop, self.stored):
+                signals.frombytes(
+                    self._get_mapped()[start:min(stop, self.stored)])
+            signals.extend(self.chunk[max(0, start - self.stored):
+                                      max(0, stop - self.stored)])
+            return signals
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("trace index out of range")
+        if index >= self.stored:
+            return self.chunk[index - self.stored]
+        return self._get_mapped()[index]
+
+    def __iter__(self):
+        """Return an iterator of the signals, paged in chunk by chunk."""
+        for start in range(0, len(self), self.chunk_size):
+            yield from self[start:start + self.chunk_size]
+
+    def append(self, signal):
+        """Add the signal, writing the chunk to the file when it is full."""
+        self.chunk.append(signal)
+        if len(self.chunk) >= self.chunk_size:
+            self.trace_file.seek(0, 2)  # end of the file
+            self.trace_file.write(self.chunk.tobytes())
+            self.trace_file.flush()
+            self.stored += len(self.chunk)
+            self.chunk = array.array("b")
+            if self.mapped is not None:  # map the longer file when read
+                self.mapped.close()
+                self.mapped = None
+
+    def close(self):
+        """Close and delete the file of the trace."""
+        if self.mapped is not None:
+            self.mapped.close()
+            self.mapped = None
+        self.trace_file.close()
 
 
 class Monitors:
@@ -22,6 +272,14 @@ class Monitors:
     names: instance of the names.Names() class.
     devices: instance of the devices.Devices() class.
     network: instance of the network.Network() class.
+    run_length: store the traces as runs of equal signals, instead of one
+                signal per cycle.
+    history: number of most recent cycles to keep in each trace, or None to
+             keep them all. If given, run_length and trace_directory are
+             ignored.
+    trace_directory: directory in which to store the traces in memory-mapped
+                     files, or None to keep them in memory. If given,
+                     run_length is ignored.
 
     Public methods
     --------------
@@ -34,28 +292,57 @@ class Monitors:
     get_monitor_signal(self, device_id, output_id): Returns the signal level of
                                                     the specified monitor.
 
+    get_trace(self, device_id, output_id): Returns a read-only view of the
+                                           signal trace of the monitor.
+
+    get_runs(self, device_id, output_id, start=0, stop=None): Returns the
+                       (signal, length) runs of the signal trace of the
+                       monitor, from index start to stop.
+
+    get_first_cycle(self, device_id, output_id): Returns the simulation cycle
+                           of the first signal kept in the monitor's trace.
+
     record_signals(self): Records the current signal level of all monitors.
 
+    add_writer(self, writer): Adds a writer to be given the signals of every
+                              recorded cycle.
+
+    remove_writer(self, writer): Removes the writer from the monitors.
+
     get_signal_names(self): Returns two lists of signal names: monitored and
                             not monitored.
 
     reset_monitors(self): Clears the memory of all monitors.
 
+    load_scenario(self, scenarios, scenario): Replaces the memory of all
+                       monitors with their traces in the specified scenario.
+
     get_margin(self): Returns the length of the longest monitor's name.
 
     display_signals(self): Displays signal trace(s) in the text console.
     """
 
-    def __init__(self, names, devices, network):
+    def __init__(self, names, devices, network, run_length=False,
+                 history=None, trace_directory=None):
         """Initialise the monitors dictionary and monitor errors."""
         self.names = names
         self.network = network
         self.devices = devices
+        self.run_length = run_length
+        self.history = history
+        self.trace_directory = trace_directory
 
         # monitors_dictionary stores
-        # {(device_id, output_id): [signal_list]}
+        # {(device_id, output_id): signal_list}, where each signal_list is an
+        # array of signed bytes, one per cycle, rather than a list of ints,
+        # a RunLengthTrace if run_length is True, a RingTrace if a history
+        # is given, or a MappedTrace if a trace_directory is given
         self.monitors_dictionary = collections.OrderedDict()
 
+        # writers are given the signals of every recorded cycle, such as
+        # vcd.VcdWriter() instances
+        self.writers = []
+
         [self.NO_ERROR, self.NOT_OUTPUT,
          self.MONITOR_PRESENT] = self.names.unique_error_codes(3)
 
@@ -73,11 +360,11 @@ class Monitors:
             return self.MONITOR_PRESENT
         else:
             # If n simulation cycles have been completed before making this
-            # monitor, then initialise the signal trace with an n-length list
+            # monitor, then initialise the signal trace with an n-length array
             # of BLANK signals. Otherwise, initialise the trace with an empty
-            # list.
-            self.monitors_dictionary[(device_id, output_id)] = [
-                self.devices.BLANK] * cycles_completed
+            # array.
+            self.monitors_dictionary[(device_id, output_id)] = \
+                self._new_trace([self.devices.BLANK] * cycles_completed)
             return self.NO_ERROR
 
     def remove_monitor(self, device_id, output_id):
@@ -101,15 +388,98 @@ class Monitors:
         else:
             return None
 
+    def _new_trace(self, signal_list=()):
+        """Return a new signal trace holding the signals in signal_list."""
+        if self.history is not None:
+            return RingTrace(self.history, signal_list)
+        if self.trace_directory is not None:
+            return MappedTrace(self.trace_directory, signal_list)
+        if self.run_length:
+            return RunLengthTrace(signal_list)
+        return array.array("b", signal_list)
+
+    def get_trace(self, device_id, output_id):
+        """Return a read-only view of the signal trace of the monitor.
+
+        The memoryview shares the monitor's memory, so it is not copied and
+        can be wrapped by numpy.asarray() without copying either. It must be
+        released before more signals are recorded. The other kinds of trace
+        are copied into an array first. If the monitor does not exist, return
+        None.
+        """
+        if (device_id, output_id) in self.monitors_dictionary:
+            signal_list = self.monitors_dictionary[(device_id, output_id)]
+            if not isinstance(signal_list, array.array):
+                signal_list = array.array("b", signal_list)
+            return memoryview(signal_list).toreadonly()
+        else:
+            return None
+
+    def get_runs(self, device_id, output_id, start=0, stop=None):
+        """Return the (signal, length) runs of the signal trace.
+
+        Return an iterator over the runs of equal signals from index start to
+        stop of the trace, so that each run can be drawn in one go. Only the
+        signals in that range of a memory-mapped trace are read. If the
+        monitor does not exist, return None.
+        """
+        if (device_id, output_id) not in self.monitors_dictionary:
+            return None
+        signal_list = self.monitors_dictionary[(device_id, output_id)]
+        if isinstance(signal_list, MappedTrace):
+            signal_list = signal_list[start:stop]
+        elif start != 0 or stop is not None:
+            signal_list = itertools.islice(signal_list, start, stop)
+        elif isinstance(signal_list, RunLengthTrace):
+            return signal_list.runs()
+        return ((signal, len(list(run))) for signal, run
+                in itertools.groupby(signal_list))
+
+    def get_first_cycle(self, device_id, output_id):
+        """Return the simulation cycle of the first signal in the trace.
+
+        This is 0 unless a history is kept and older cycles have been
+        dropped. If the monitor does not exist, return None.
+        """
+        if (device_id, output_id) not in self.monitors_dictionary:
+            return None
+        signal_list = self.monitors_dictionary[(device_id, output_id)]
+        if isinstance(signal_list, RingTrace):
+            return signal_list.first_cycle
+        return 0
+
     def record_signals(self):
         """Record the current signal level for every monitor.
 
-        This function is called at every simulation cycle.
+        This function is called at every simulation cycle. The signals are
+        also passed on to every writer.
         """
+        signals = []
         for device_id, output_id in self.monitors_dictionary:
             signal_level = self.get_monitor_signal(device_id, output_id)
             self.monitors_dictionary[(device_id,
                                       output_id)].append(signal_level)
+            signals.append(((device_id, output_id), signal_level))
+        for writer in self.writers:
+            writer.write_signals(signals)
+
+    def add_writer(self, writer):
+        """Add a writer to be given the signals of every recorded cycle.
+
+        The writer's write_signals() method is called by record_signals()
+        with a list of ((device_id, output_id), signal) pairs.
+        """
+        self.writers.append(writer)
+
+    def remove_writer(self, writer):
+        """Remove the writer from the monitors.
+
+        Return True if successful.
+        """
+        if writer not in self.writers:
+            return False
+        self.writers.remove(writer)
+        return True
 
     def get_signal_names(self):
         """Return two signal name lists: monitored and not monitored."""
@@ -132,10 +502,28 @@ class Monitors:
     def reset_monitors(self):
         """Clear the memory of all the monitors.
 
-        The list of stored signal levels for each monitor is deleted.
+        The array of stored signal levels for each monitor is deleted.
+        """
+        for device_id, output_id in self.monitors_dictionary:
+            self.monitors_dictionary[(device_id, output_id)] = \
+                self._new_trace()
+
+    def load_scenario(self, scenarios, scenario):
+        """Replace the memory of all monitors with one scenario's traces.
+
+        The traces are unpacked from a scenarios.Scenarios() instance, so that
+        they can be displayed like any other simulation run. Return True if
+        successful.
         """
+        if scenario not in range(scenarios.count):
+            return False
         for device_id, output_id in self.monitors_dictionary:
-            self.monitors_dictionary[(device_id, output_id)] = []
+            signal_list = scenarios.get_trace(device_id, output_id, scenario)
+            if signal_list is None:  # not monitored while the scenarios ran
+                signal_list = []
+            self.monitors_dictionary[(device_id, output_id)] = \
+                self._new_trace(signal_list)
+        return True
 
     def get_margin(self):
         """Return the length of the longest monitor's name.
@@ -155,22 +543,25 @@ class Monitors:
             return None
 
     def display_signals(self):
-        """Display the signal trace(s) in the text console."""
+        """Display the signal trace(s) in the text console.
+
+        If a history is kept, only the cycles kept are displayed.
+        """
         margin = self.get_margin()
         for device_id, output_id in self.monitors_dictionary:
             monitor_name = self.devices.get_signal_name(device_id, output_id)
             name_length = len(monitor_name)
-            signal_list = self.monitors_dictionary[(device_id, output_id)]
             print(monitor_name + (margin - name_length) * " ", end=": ")
-            for signal in signal_list:
+            # Print each run of equal signals at once
+            for signal, length in self.get_runs(device_id, output_id):
                 if signal == self.devices.HIGH:
-                    print("-", end="")
+                    print("-" * length, end="")
                 if signal == self.devices.LOW:
-                    print("_", end="")
+                    print("_" * length, end="")
                 if signal == self.devices.RISING:
-                    print("/", end="")
+                    print("/" * length, end="")
                 if signal == self.devices.FALLING:
-                    print("\\", end="")
+                    print("\\" * length, end="")
                 if signal == self.devices.BLANK:
-                    print(" ", end="")
+                    print(" " * length, end="")
             print("\n", end="")
@@ -6,6 +6,7 @@ Classes
 --------
 Network - builds and executes the network.
 """
+import heapq
 
 
 class Network:
@@ -56,6 +57,16 @@ class Network:
     update_clocks(self): If it is time to do so, sets clock signals to RISING
                          or FALLING.
 
+    levelize(self): Builds the levelized evaluation schedule of the network.
+
+    get_schedule(self): Returns the levelized schedule, rebuilding it if the
+                        network has changed.
+
+    build_fanout(self): Builds the index of the inputs driven by each output.
+
+    get_fanout(self): Returns the fanout index, rebuilding it if the network
+                      has changed.
+
     execute_network(self): Executes all the devices in the network for one
                            simulation cycle.
     """
@@ -72,6 +83,37 @@ class Network:
          self.SECOND_DEVICE_ABSENT] = self.names.unique_error_codes(8)
         self.steady_state = True  # for checking if signals have settled
 
+        # Execution engines for execute_network
+        self.engine_types = [self.ITERATIVE, self.LEVELIZED,
+                             self.EVENT_DRIVEN] = range(3)
+        self.engine = self.ITERATIVE
+
+        # (x, y) pairs for execute_gate: if all inputs are x, output is y
+        self.gate_rules = {
+            self.devices.AND: (self.devices.HIGH, self.devices.HIGH),
+            self.devices.OR: (self.devices.LOW, self.devices.LOW),
+            self.devices.NAND: (self.devices.HIGH, self.devices.LOW),
+            self.devices.NOR: (self.devices.LOW, self.devices.HIGH),
+            self.devices.XOR: (None, None)}
+
+        # schedule stores a list of levels, each a list of
+        # (device_id_list, is_feedback) components. None if not yet built.
+        # schedule_order lists the same components in evaluation order, and
+        # schedule_index stores {device_id: index into schedule_order}.
+        self.schedule = None
+        self.schedule_order = []
+        self.schedule_index = {}
+        self.schedule_size = 0  # number of devices when schedule was built
+
+        # fanout stores {(device_id, output_id): [driven device_id, ...]}
+        self.fanout = None
+        self.fanout_size = 0  # number of devices when fanout was built
+
+        # source_signals stores the settled {(device_id, output_id): signal}
+        # of the switches, clocks, siggens and D-types after the last
+        # event-driven cycle. None forces every gate to be evaluated.
+        self.source_signals = None
+
     def get_connected_output(self, device_id, input_id):
         """Return the output connected to the given input.
 
@@ -135,6 +177,7 @@ class Network:
                 # Make connection
                 first_device.inputs[first_port_id] = (second_device_id,
                                                       second_port_id)
+                self.schedule = self.fanout = None
                 error_type = self.NO_ERROR
             else:  # second_port_id is not a valid input or output port
                 error_type = self.SECOND_PORT_ABSENT
@@ -150,6 +193,7 @@ class Network:
                 else:
                     second_device.inputs[second_port_id] = (first_device_id,
                                                             first_port_id)
+                    self.schedule = self.fanout = None
                     error_type = self.NO_ERROR
             else:
                 error_type = self.SECOND_PORT_ABSENT
@@ -397,9 +441,349 @@ class Network:
             else:
                 device.siggen_counter = device.siggen_counter + 1
 
+    def _strongly_connected(self, nodes, successors):
+        """Return the strongly connected components of a graph.
+
+        The components are returned in topological order. Tarjan's algorithm
+        is run with an explicit stack so that long chains of gates do not
+        exceed the recursion limit.
+        """
+        index = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+        for root in nodes:
+            if root in index:
+                continue
+            work = [(root, iter(successors[root]))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, children = work[-1]
+                for child in children:
+                    if child not in index:
+                        index[child] = lowlink[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(successors[child])))
+                        break
+                    elif child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+        components.reverse()  # Tarjan finds sink components first
+        return components
+
+    def levelize(self):
+        """Build the levelized evaluation schedule of the network.
+
+        Gates are ordered so that every gate comes after the gates driving it.
+        The combinational graph is broken at the D-types, whose outputs only
+        change on a clock edge or a SET or CLEAR. Gates on a combinational
+        loop are grouped into one feedback component.
+
+        Return the schedule, or None if a D-type's CLK, SET or CLEAR input is
+        driven by a gate (or its CLK by another D-type). Such inputs can see
+        the transient signals of the gates, which only the iterative engine
+        reproduces.
+        """
+        devices = self.devices
+        asynchronous_ids = [devices.CLK_ID, devices.SET_ID, devices.CLEAR_ID]
+        nodes = []
+        successors = {}
+        predecessors = {}
+        for device in devices.devices_list:
+            if device.device_kind in self.gate_rules:
+                nodes.append(device.device_id)
+                successors[device.device_id] = []
+                predecessors[device.device_id] = []
+
+        for device in devices.devices_list:
+            for input_id, connected_output in device.inputs.items():
+                if connected_output is None:
+                    continue
+                driver_id = connected_output[0]
+                if device.device_kind == devices.D_TYPE:
+                    if input_id not in asynchronous_ids:
+                        continue
+                    driver = devices.get_device(driver_id)
+                    if (driver_id in successors or (
+                            input_id == devices.CLK_ID
+                            and driver.device_kind == devices.D_TYPE)):
+                        self.schedule = None
+                        return None
+                elif driver_id in successors:
+                    successors[driver_id].append(device.device_id)
+                    predecessors[device.device_id].append(driver_id)
+
+        component_level = {}  # {device_id: level of its component}
+        schedule = []
+        for component in self._strongly_connected(nodes, successors):
+            members = set(component)
+            level = 0
+            is_feedback = len(component) > 1
+            for device_id in component:
+                for driver_id in predecessors[device_id]:
+                    if driver_id in members:
+                        is_feedback = True
+                    else:
+                        level = max(level, component_level[driver_id] + 1)
+            for device_id in component:
+                component_level[device_id] = level
+            while len(schedule) <= level:
+                schedule.append([])
+            schedule[level].append((component, is_feedback))
+
+        self.schedule = schedule
+        self.schedule_size = len(devices.devices_list)
+        self.schedule_order = []
+        self.schedule_index = {}
+        for level in schedule:
+            for component in level:
+                for device_id in component[0]:
+                    self.schedule_index[device_id] = len(self.schedule_order)
+                self.schedule_order.append(component)
+        self.source_signals = None
+        return schedule
+
+    def get_schedule(self):
+        """Return the levelized schedule, rebuilding it if it is stale."""
+        if (self.schedule is None
+                or self.schedule_size != len(self.devices.devices_list)):
+            return self.levelize()
+        return self.schedule
+
+    def _settle_gate(self, device):
+        """Set a gate's output to its settled value.
+
+        All the gate's inputs must already be settled to HIGH or LOW. Return
+        True if successful.
+        """
+        get_device = self.devices.devices_dictionary.get
+        input_signals = []
+        for connected_output in device.inputs.values():
+            if connected_output is None:  # this input is unconnected
+                return False
+            (output_device_id, output_port_id) = connected_output
+            input_signals.append(
+                get_device(output_device_id).outputs[output_port_id])
+        (x, y) = self.gate_rules[device.device_kind]
+        if device.device_kind == self.devices.XOR:
+            if input_signals[0] == input_signals[1]:
+                device.outputs[None] = self.devices.LOW
+            else:
+                device.outputs[None] = self.devices.HIGH
+        elif all(signal == x for signal in input_signals):
+            device.outputs[None] = y
+        else:
+            device.outputs[None] = self.invert_signal(y)
+        return True
+
+    def _execute_device(self, device_id):
+        """Execute a gate, switch or D-type. Return True if successful."""
+        device = self.devices.get_device(device_id)
+        if device.device_kind == self.devices.D_TYPE:
+            return self.execute_d_type(device_id)
+        if device.device_kind == self.devices.SWITCH:
+            return self.execute_switch(device_id)
+        (x, y) = self.gate_rules[device.device_kind]
+        return self.execute_gate(device_id, x, y)
+
+    def _settle_devices(self, device_ids, iteration_limit=20):
+        """Execute the devices repeatedly until their outputs settle.
+
+        Return True if the devices settle within iteration_limit passes.
+        """
+        for _ in range(iteration_limit):
+            self.steady_state = True
+            for device_id in device_ids:
+                if not self._execute_device(device_id):
+                    return False
+            if self.steady_state:
+                return True
+        return False
+
+    def build_fanout(self):
+        """Build the index of the inputs driven by each output.
+
+        Return the fanout dictionary, mapping each (device_id, output_id) to
+        the list of devices with an input connected to it.
+        """
+        fanout = {}
+        for device in self.devices.devices_list:
+            for output_id in device.outputs:
+                fanout[(device.device_id, output_id)] = []
+        for device in self.devices.devices_list:
+            for connected_output in device.inputs.values():
+                if connected_output in fanout:
+                    driven = fanout[connected_output]
+                    # A device's repeated inputs are found consecutively
+                    if not driven or driven[-1] != device.device_id:
+                        driven.append(device.device_id)
+        self.fanout = fanout
+        self.fanout_size = len(self.devices.devices_list)
+        return fanout
+
+    def get_fanout(self):
+        """Return the fanout index, rebuilding it if it is stale."""
+        if (self.fanout is None
+                or self.fanout_size != len(self.devices.devices_list)):
+            return self.build_fanout()
+        return self.fanout
+
+    def _execute_sequential(self):
+        """Execute the switches, D-types, clocks and siggens for one cycle.
+
+        The devices are first executed exactly as in the first pass of the
+        iterative engine, so the D-types sample the values settled in the
+        previous cycle, and then the switches and D-types are settled.
+        Return True if successful.
+        """
+        switch_devices = self.devices.find_devices(self.devices.SWITCH)
+        d_type_devices = self.devices.find_devices(self.devices.D_TYPE)
+        self.update_clocks()
+        self.update_siggens()
+
+        for device_id in switch_devices:
+            if not self.execute_switch(device_id):
+                return False
+        for device_id in d_type_devices:
+            if not self.execute_d_type(device_id):
+                return False
+        for device_id in self.devices.find_devices(self.devices.CLOCK):
+            if not self.execute_clock(device_id):
+                return False
+        for device_id in self.devices.find_devices(self.devices.SIGGEN):
+            if not self.execute_siggen(device_id):
+                return False
+        return self._settle_devices(switch_devices + d_type_devices)
+
+    def _execute_levelized(self):
+        """Execute the network for one cycle in levelized order.
+
+        Once the sequential devices have settled, every gate is evaluated
+        once, in level order, and only feedback components are iterated.
+        """
+        schedule = self.get_schedule()
+        if schedule is None:  # needs iterating to find the clock edges
+            return self._execute_iterative()
+        if not self._execute_sequential():
+            return False
+
+        get_device = self.devices.devices_dictionary.get
+        for level in schedule:
+            for component, is_feedback in level:
+                if is_feedback:
+                    if not self._settle_devices(component):
+                        return False
+                elif not self._settle_gate(get_device(component[0])):
+                    return False
+        self.steady_state = True
+        return True
+
+    def _execute_event_driven(self):
+        """Execute the network for one cycle, only updating changed gates.
+
+        The sequential devices are executed as in the levelized engine. Only
+        the gates driven by an output that changed are then evaluated, in
+        level order, and a gate whose output changes schedules the gates it
+        drives in turn.
+        """
+        schedule = self.get_schedule()
+        if schedule is None:  # needs iterating to find the clock edges
+            self.source_signals = None
+            return self._execute_iterative()
+        fanout = self.get_fanout()
+        if not self._execute_sequential():
+            self.source_signals = None
+            return False
+
+        get_device = self.devices.devices_dictionary.get
+        components = self.schedule_order
+        component_index = self.schedule_index
+
+        # Find which outputs of the sequential devices have changed
+        source_signals = {}
+        for device_kind in [self.devices.SWITCH, self.devices.CLOCK,
+                            self.devices.SIGGEN, self.devices.D_TYPE]:
+            for device_id in self.devices.kind_dictionary.get(device_kind, []):
+                outputs = get_device(device_id).outputs
+                for output_id, signal in outputs.items():
+                    source_signals[(device_id, output_id)] = signal
+        if self.source_signals is None:
+            pending = set(range(len(components)))
+        else:
+            pending = set()
+            for output, signal in source_signals.items():
+                if self.source_signals.get(output) != signal:
+                    for device_id in fanout[output]:
+                        if device_id in component_index:
+                            pending.add(component_index[device_id])
+        self.source_signals = None  # until this cycle has settled
+
+        queue = list(pending)
+        heapq.heapify(queue)
+        while queue:
+            index = heapq.heappop(queue)
+            component, is_feedback = components[index]
+            old_signals = [get_device(device_id).outputs[None]
+                           for device_id in component]
+            if is_feedback:
+                if not self._settle_devices(component):
+                    return False
+            elif not self._settle_gate(get_device(component[0])):
+                return False
+            for device_id, old_signal in zip(component, old_signals):
+                if get_device(device_id).outputs[None] == old_signal:
+                    continue
+                for driven_id in fanout[(device_id, None)]:
+                    driven_index = component_index.get(driven_id)
+                    if (driven_index is not None
+                            and driven_index not in pending):
+                        pending.add(driven_index)
+                        heapq.heappush(queue, driven_index)
+            pending.discard(index)
+
+        self.source_signals = source_signals
+        self.steady_state = True
+        return True
+
     def execute_network(self):
         """Execute all the devices in the network for one simulation cycle.
 
+        The network is executed with the engine selected in self.engine,
+        which is either one of self.engine_types or an engine object with its
+        own execute_network method, such as vector.VectorEngine.
+        Return True if successful and the network does not oscillate.
+        """
+        if self.engine not in self.engine_types:
+            return self.engine.execute_network()
+        if self.engine == self.LEVELIZED:
+            return self._execute_levelized()
+        if self.engine == self.EVENT_DRIVEN:
+            return self._execute_event_driven()
+        return self._execute_iterative()
+
+    def _execute_iterative(self):
+        """Execute the network by iterating until the signals settle.
+
         Return True if successful and the network does not oscillate.
         """
         clock_devices = self.devices.find_devices(self.devices.CLOCK)
@@ -8,6 +8,15 @@ Classes
 Scanner - reads definition file and translates characters into symbols.
 Symbol - encapsulates a symbol and stores its properties.
 """
+import re
+import sys
+
+# Runs of characters matched in one step by the fast tokenizer. Only ASCII
+# characters are matched, so that the runs agree with str.isalnum() and
+# str.isdigit() used by the character loops.
+_WORD = re.compile(r"[A-Za-z0-9_]*")
+_DIGITS = re.compile(r"[0-9]*")
+_WHITESPACE = re.compile(r"[ \n]*")
 
 
 class Symbol:
@@ -36,10 +45,19 @@ class Scanner:
     that the parser can use. It also skips over comments and irrelevant
     formatting characters, such as spaces and line breaks.
 
+    The file is read in chunks as the symbols are needed, so a definition
+    can also be streamed from a pipe or standard input while it is being
+    generated, without being held in memory as a whole.
+
     Parameters
     ----------
-    path: path to the circuit definition file.
+    path: path to the circuit definition file, "-" for standard input, or a
+          text file object to read the definition from.
     names: instance of the names.Names() class.
+    fast: if True, whole strings, integers and runs of whitespace are
+          matched with regular expressions rather than read one character
+          at a time. The symbols returned are the same either way.
+    chunk_size: number of characters read from the file at a time.
 
     Public methods
     -------------
@@ -47,19 +65,34 @@ class Scanner:
                       and returns the symbol.
     """
 
-    def __init__(self, path, names):
+    def __init__(self, path, names, fast=True, chunk_size=65536):
         """Open specified file and initialise reserved words and IDs."""
         # Checks file handling error
         print("\nNow opening file...")
-        print("Path: " + path)
-        try:
-            file = open(path, "r")
-        except FileNotFoundError:
-            print("Error: file not found.")
-        conte = file.read()
-        self.contents = list(conte)
+        self.close_file = False  # only close the files opened here
+        if path == "-":
+            print("Path: standard input")
+            file = sys.stdin
+        elif isinstance(path, str):
+            print("Path: " + path)
+            try:
+                file = open(path, "r")
+                self.close_file = True
+            except FileNotFoundError:
+                print("Error: file not found.")
+        else:  # an open file object
+            file = path
+        self.file = file  # None once the whole file has been read
+        self.chunk_size = chunk_size
+        # The chunk read last is read through a cursor, as slicing the
+        # contents after every character would make scanning quadratic
+        self.contents = ""
+        self.position = 0  # index of the next character in the contents
+        # pushed_back stores characters to read before the contents, last
+        # character first
+        self.pushed_back = []
+        self.fast = fast
         print("File opened successfully.")
-        file.close()
         self.names = names
         self.symbol_type_list = [
             self.KEYWORD, self.DEVICE_TYPE, self.STRING,
@@ -87,14 +120,30 @@ class Scanner:
          self.NOR_ID, self.XOR_ID, self.CLOCK_ID,
          self.SWITCH_ID, self.DTYPE_ID, self.SIGGEN_ID] = \
             self.names.lookup(self.device_list)
+        # Symbol types of the single character punctuation
+        self.punctuation_types = {"=": self.EQUALS, "-": self.DASH,
+                                  "/": self.SLASH, ",": self.COMMA,
+                                  ">": self.ARROW, "_": self.UNDERSCORE}
+        self.keyword_regex = re.compile(
+            "|".join(re.escape(keyword) for keyword in self.keywords_list))
         self._advance()
 
     def _skip_whitespace(self):
         """Skip whitespace and newlines in the file contents."""
+        if (self.fast and not self.pushed_back
+                and self.current_character in [" ", "\n"]):
+            end = _WHITESPACE.match(self.contents, self.position).end()
+            if end < len(self.contents):
+                self.current_character = self.contents[end]
+                self.position = end + 1
+                return
+            elif end > self.position:  # read on from the next chunk
+                self.current_character = self.contents[-1]
+                self.position = end
         while True:
             if self.current_character not in [" ", "\n"]:
                 break
-            elif len(self.contents) == 0:
+            elif self._at_end():
                 break
             self._advance()
 
@@ -116,11 +165,15 @@ class Scanner:
 
         Skips comments if encountered.
         """
+        if self.fast:
+            string = self._match_string()
+            if string is not None:
+                return string
         string = ""
         while True:
             if self.current_character == "#":
                 self._skip_comment()
-            elif len(self.contents) == 0:
+            elif self._at_end():
                 string += self.current_character
                 return string
             elif self.current_character in ["", "\n"]:
@@ -133,10 +186,7 @@ class Scanner:
                 ensures the connection is recorded seperately"""
                 for i in self.keywords_list:
                     if i in string and string != i:
-                        replaced = []
-                        for char in i:
-                            replaced.append(char)
-                        self.contents = replaced + self.contents
+                        self.pushed_back.extend(reversed(i))
                         string = string.removesuffix(i)
                         return string
                     elif i in string:
@@ -150,11 +200,15 @@ class Scanner:
 
         Skips comments and whitespace if encountered.
         """
+        if self.fast:
+            integer = self._match_integer()
+            if integer is not None:
+                return integer
         integer = ""
         while True:
             if self.current_character == "#":
                 self._skip_comment()
-            elif len(self.contents) == 0:
+            elif self._at_end():
                 integer += self.current_character
                 return integer
             elif self.current_character in ["", "\n"]:
@@ -166,25 +220,109 @@ class Scanner:
                 break
         return integer
 
+    def _is_delimiter(self, index):
+        """Return True if the character at index ends a string or integer.
+
+        Comments and line breaks do not end them, and neither may a
+        character outside ASCII or the last character of the file, so these
+        are left to the character loops. So are the characters at the end of
+        the chunk, which may be followed by more of the same symbol.
+        """
+        return (index < len(self.contents) - 1
+                and self.contents[index] < "\x80"
+                and self.contents[index] not in ["#", "\n"])
+
+    def _match_string(self):
+        """Return the string starting at the current character.
+
+        The string is matched in one step, and split at the first keyword
+        in the same way as _get_string(). Return None if the string needs
+        to be read by the character loop of _get_string() instead.
+        """
+        if self.pushed_back:
+            return None
+        end = _WORD.match(self.contents, self.position).end()
+        string = self.current_character + self.contents[self.position:end]
+        keyword = self.keyword_regex.search(string)
+        if keyword is None:
+            if not self._is_delimiter(end):
+                return None
+        else:
+            # Stop after the keyword, unless it ends the chunk
+            end = self.position + keyword.end() - 1
+            if end >= len(self.contents):
+                return None
+        self.current_character = self.contents[end]
+        self.position = end + 1
+        if keyword is None:
+            return string
+        elif keyword.start() > 0:  # read the keyword again as a new symbol
+            self.pushed_back.extend(reversed(keyword.group()))
+            return string[:keyword.start()]
+        return keyword.group()
+
+    def _match_integer(self):
+        """Return the integer starting at the current character.
+
+        Return None if the integer needs to be read by the character loop
+        of _get_integer() instead.
+        """
+        if self.pushed_back:
+            return None
+        end = _DIGITS.match(self.contents, self.position).end()
+        if not self._is_delimiter(end):
+            return None
+        integer = self.current_character + self.contents[self.position:end]
+        self.current_character = self.contents[end]
+        self.position = end + 1
+        return integer
+
+    def _read_chunk(self):
+        """Read the next chunk of the file into the contents.
+
+        The characters already read are dropped. Return False if there are
+        no characters left in the file.
+        """
+        if self.file is None:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            if self.close_file:
+                self.file.close()
+            self.file = None
+            return False
+        self.contents = self.contents[self.position:] + chunk
+        self.position = 0
+        return True
+
     def _advance(self):
         """Advance to the next character in the file contents.
         If there are no characters left, return the end of file character."""
-        try:
-            self.current_character = self.contents[0]
-            self.contents = self.contents[1:]
-        except IndexError:
+        if self.pushed_back:
+            self.current_character = self.pushed_back.pop()
+        elif (self.position < len(self.contents)
+              or self._read_chunk()):
+            self.current_character = self.contents[self.position]
+            self.position += 1
+        else:
             self.current_character = ""
 
+    def _at_end(self):
+        """Return True if no characters are left after the current one."""
+        return (not self.pushed_back
+                and self.position >= len(self.contents)
+                and not self._read_chunk())
+
     def get_symbol(self):
         """Translate the next sequence of characters into a symbol."""
         # Create a new symbol to return
         symbol = Symbol()
-        if not len(self.contents) == 0:
+        if not self._at_end():
             self._skip_whitespace()
         # Skip comments, if found, and leading whitespace
         if self.current_character == "#":
             self._skip_comment()
-        if not len(self.contents) == 0:
+        if not self._at_end():
             self._skip_whitespace()
         if self.current_character.isalpha():  # Strings, keywords, device types
             string = self._get_string()
@@ -199,28 +337,8 @@ class Scanner:
             integer = self._get_integer()
             symbol.id = self.names.lookup([integer])[0]
             symbol.type = self.INTEGER
-        elif self.current_character == "=":  # Singular punctuation
-            symbol.type = self.EQUALS
-            symbol.id = self.names.lookup([self.current_character])[0]
-            self._advance()
-        elif self.current_character == "-":  # And so forth
-            symbol.type = self.DASH
-            symbol.id = self.names.lookup([self.current_character])[0]
-            self._advance()
-        elif self.current_character == "/":
-            symbol.type = self.SLASH
-            symbol.id = self.names.lookup([self.current_character])[0]
-            self._advance()
-        elif self.current_character == ",":
-            symbol.type = self.COMMA
-            symbol.id = self.names.lookup([self.current_character])[0]
-            self._advance()
-        elif self.current_character == ">":
-            symbol.type = self.ARROW
-            symbol.id = self.names.lookup([self.current_character])[0]
-            self._advance()
-        elif self.current_character == "_":
-            symbol.type = self.UNDERSCORE
+        elif self.current_character in self.punctuation_types:
+            symbol.type = self.punctuation_types[self.current_character]
             symbol.id = self.names.lookup([self.current_character])[0]
             self._advance()
         elif self.current_character == "":  # End of file
@@ -0,0 +1,348 @@
+"""Simulate many switch configurations of the network at once.
+
+Used in the Logic Simulator project to sweep switch configurations through
+the same network, evaluating every configuration in a single pass by packing
+one configuration into each bit of an integer word.
+
+Classes
+-------
+Scenarios - simulates bit-parallel switch configurations of a network.
+"""
+
+
+class Scenarios:
+    """Simulate bit-parallel switch configurations of a network.
+
+    Every signal is held as a pair of integer words, with one bit per
+    scenario. The level word holds the signal's value and the edge word is set
+    while the signal is RISING or FALLING, so that
+
+        LOW = (0, 0), HIGH = (1, 0), RISING = (1, 1), FALLING = (0, 1).
+
+    Python integers have no fixed width, so any number of scenarios (64 or
+    N x 64) is packed into one word. The devices are executed in the same
+    order and with the same RISING and FALLING rules as Network, so every
+    scenario follows exactly the signals the network would give for it.
+    Clocks, siggens and the initial D-type states are shared by all the
+    scenarios.
+
+    Parameters
+    ----------
+    names: instance of the names.Names() class.
+    devices: instance of the devices.Devices() class.
+    network: instance of the network.Network() class.
+    monitors: instance of the monitors.Monitors() class.
+    count: number of scenarios.
+
+    Public methods
+    --------------
+    reset(self): Loads the current device states into every scenario and
+                 clears the recorded traces.
+
+    set_switch(self, device_id, scenario, signal): Sets the switch state of
+                                                   the specified scenario.
+
+    execute_network(self): Executes all the devices in every scenario for
+                           one simulation cycle.
+
+    record_signals(self): Records the packed signal level of all monitors.
+
+    get_trace(self, device_id, output_id, scenario): Returns the signal trace
+                       of the specified monitor in the specified scenario.
+    """
+
+    def __init__(self, names, devices, network, monitors, count=64):
+        """Initialise the scenario words from the current device states."""
+        self.names = names
+        self.devices = devices
+        self.network = network
+        self.monitors = monitors
+
+        self.count = count
+        self.mask = (1 << count) - 1  # one bit set for every scenario
+
+        # level and edge store {(device_id, output_id): word}
+        self.level = {}
+        self.edge = {}
+        # switch_words and memory_words store {device_id: word}
+        self.switch_words = {}
+        self.memory_words = {}
+        # packed_traces stores {(device_id, output_id): [level word, ...]}
+        self.packed_traces = {}
+
+        self.steady_state = True
+        self.reset()
+
+    def _broadcast(self, signal):
+        """Return the (level, edge) words of signal in every scenario."""
+        level = self.mask if signal in [self.devices.HIGH,
+                                        self.devices.RISING] else 0
+        edge = self.mask if signal in [self.devices.RISING,
+                                       self.devices.FALLING] else 0
+        return (level, edge)
+
+    def reset(self):
+        """Load the current device states into every scenario.
+
+        Also clear the recorded traces. Call this after cold_startup().
+        """
+        self.level = {}
+        self.edge = {}
+        for device in self.devices.devices_list:
+            for output_id, signal in device.outputs.items():
+                output = (device.device_id, output_id)
+                (self.level[output], self.edge[output]) = \
+                    self._broadcast(signal)
+            if device.device_kind == self.devices.SWITCH:
+                if device.device_id not in self.switch_words:
+                    self.switch_words[device.device_id] = \
+                        self._broadcast(device.switch_state)[0]
+            elif device.device_kind == self.devices.D_TYPE:
+                self.memory_words[device.device_id] = \
+                    self._broadcast(device.dtype_memory)[0]
+        self.packed_traces = {}
+
+    def set_switch(self, device_id, scenario, signal):
+        """Set the switch state of the specified scenario to signal.
+
+        Return True if successful.
+        """
+        device = self.devices.get_device(device_id)
+        if device is None or device.device_kind != self.devices.SWITCH:
+            return False
+        if scenario not in range(self.count):
+            return False
+        bit = 1 << scenario
+        if signal == self.devices.HIGH:
+            self.switch_words[device_id] |= bit
+        elif signal == self.devices.LOW:
+            self.switch_words[device_id] &= ~bit
+        else:
+            return False
+        return True
+
+    def _is_high(self, output):
+        """Return the word of scenarios where the output is HIGH."""
+        return self.level[output] & ~self.edge[output] & self.mask
+
+    def _is_low(self, output):
+        """Return the word of scenarios where the output is LOW."""
+        return ~self.level[output] & ~self.edge[output] & self.mask
+
+    def _update_signal(self, output, target):
+        """Update the output in the direction of the target word.
+
+        This is Network.update_signal applied to every scenario: the new
+        level is the target, and the signal is RISING or FALLING wherever the
+        old level differs from it.
+        """
+        level = self.level[output]
+        edge = self.edge[output]
+        new_edge = level ^ target
+        if target != level or new_edge != edge:
+            self.steady_state = False
+        self.level[output] = target
+        self.edge[output] = new_edge
+
+    def _execute_switch(self, device_id):
+        """Simulate a switch in every scenario."""
+        self._update_signal((device_id, None), self.switch_words[device_id])
+
+    def _execute_gate(self, device):
+        """Simulate a logic gate in every scenario, as execute_gate does."""
+        inputs = list(device.inputs.values())
+        if device.device_kind == self.devices.XOR:
+            [first, second] = inputs
+            # Output is HIGH wherever the two input signals differ
+            target = ((self.level[first] ^ self.level[second])
+                      | (self.edge[first] ^ self.edge[second]))
+        else:
+            (x, y) = self.network.gate_rules[device.device_kind]
+            all_x = self.mask
+            for connected_output in inputs:
+                if x == self.devices.HIGH:
+                    all_x &= self._is_high(connected_output)
+                else:
+                    all_x &= self._is_low(connected_output)
+            target = all_x if y == self.devices.HIGH else ~all_x & self.mask
+        self._update_signal((device.device_id, None), target)
+
+    def _settle_gate(self, device):
+        """Set a gate's output to its settled value in every scenario.
+
+        All the gate's inputs must already be settled to HIGH or LOW.
+        """
+        levels = [self.level[connected_output]
+                  for connected_output in device.inputs.values()]
+        device_kind = device.device_kind
+        if device_kind == self.devices.XOR:
+            target = levels[0] ^ levels[1]
+        elif device_kind in [self.devices.AND, self.devices.NAND]:
+            target = self.mask
+            for level in levels:
+                target &= level
+        else:
+            target = 0
+            for level in levels:
+                target |= level
+        if device_kind in [self.devices.NAND, self.devices.NOR]:
+            target = ~target & self.mask
+        output = (device.device_id, None)
+        self.level[output] = target
+        self.edge[output] = 0
+
+    def _execute_d_type(self, device):
+        """Simulate a D-type in every scenario, as execute_d_type does."""
+        devices = self.devices
+        clock = device.inputs[devices.CLK_ID]
+        data = device.inputs[devices.DATA_ID]
+        memory = self.memory_words[device.device_id]
+
+        # On a rising clock, memory is HIGH where the data is HIGH or FALLING
+        rising = self.level[clock] & self.edge[clock]
+        sampled = self.level[data] ^ self.edge[data]
+        memory = (memory & ~rising) | (sampled & rising)
+        memory |= self._is_high(device.inputs[devices.SET_ID])
+        memory &= ~self._is_high(device.inputs[devices.CLEAR_ID])
+        memory &= self.mask
+
+        self.memory_words[device.device_id] = memory
+        self._update_signal((device.device_id, devices.Q_ID), memory)
+        self._update_signal((device.device_id, devices.QBAR_ID),
+                            ~memory & self.mask)
+
+    def _load_shared(self, device_ids):
+        """Copy the shared clock or siggen signals into every scenario."""
+        for device_id in device_ids:
+            signal = self.devices.get_device(device_id).outputs[None]
+            (self.level[(device_id, None)],
+             self.edge[(device_id, None)]) = self._broadcast(signal)
+
+    def _execute_device(self, device):
+        """Simulate a gate, switch or D-type in every scenario."""
+        if device.device_kind == self.devices.D_TYPE:
+            self._execute_d_type(device)
+        elif device.device_kind == self.devices.SWITCH:
+            self._execute_switch(device.device_id)
+        else:
+            self._execute_gate(device)
+
+    def _settle_devices(self, device_list, iteration_limit=20):
+        """Execute the devices until they settle in every scenario.
+
+        Return True if they settle within iteration_limit passes.
+        """
+        for _ in range(iteration_limit):
+            self.steady_state = True
+            for device in device_list:
+                self._execute_device(device)
+            if self.steady_state:
+                return True
+        return False
+
+    def execute_network(self):
+        """Execute all the devices in every scenario for one cycle.
+
+        The network's levelized schedule is used where possible, and the
+        iterative loop of Network otherwise. Return True if successful and
+        no scenario oscillates.
+        """
+        devices = self.devices
+        get_device = devices.devices_dictionary.get
+        clock_ids = devices.find_devices(devices.CLOCK)
+        siggen_ids = devices.find_devices(devices.SIGGEN)
+        switches = [get_device(device_id)
+                    for device_id in devices.find_devices(devices.SWITCH)]
+        d_types = [get_device(device_id)
+                   for device_id in devices.find_devices(devices.D_TYPE)]
+        schedule = self.network.get_schedule()
+
+        # The shared clocks and siggens are kept in the devices themselves
+        self.network.update_clocks()
+        self.network.update_siggens()
+        self._load_shared(clock_ids + siggen_ids)
+
+        if schedule is None:
+            return self._execute_iterative(switches, d_types, clock_ids,
+                                           siggen_ids)
+
+        self.steady_state = True
+        for device in switches:
+            self._execute_switch(device.device_id)
+        for device in d_types:
+            self._execute_d_type(device)
+        self._execute_shared(clock_ids, siggen_ids)
+        if not self._settle_devices(switches + d_types):
+            return False
+
+        for level in schedule:
+            for component, is_feedback in level:
+                if is_feedback:
+                    if not self._settle_devices(
+                            [get_device(device_id)
+                             for device_id in component]):
+                        return False
+                else:
+                    self._settle_gate(get_device(component[0]))
+        self.steady_state = True
+        return True
+
+    def _execute_shared(self, clock_ids, siggen_ids):
+        """Execute the shared clocks and siggens in every scenario."""
+        for device_id in clock_ids:
+            self.network.execute_clock(device_id)
+        for device_id in siggen_ids:
+            self.network.execute_siggen(device_id)
+        for device_id in clock_ids + siggen_ids:
+            signal = self.devices.get_device(device_id).outputs[None]
+            self._update_signal((device_id, None),
+                                self._broadcast(signal)[0])
+
+    def _execute_iterative(self, switches, d_types, clock_ids, siggen_ids):
+        """Execute every scenario by iterating until the signals settle.
+
+        A scenario that has settled is unchanged by further passes, so the
+        loop stops once all of them have settled. Return True if successful.
+        """
+        gates = []
+        for device_kind in self.devices.gate_types:
+            for device_id in self.devices.find_devices(device_kind):
+                gates.append(self.devices.get_device(device_id))
+
+        iteration_limit = 20
+        for _ in range(iteration_limit):
+            self.steady_state = True
+            for device in switches:
+                self._execute_switch(device.device_id)
+            for device in d_types:
+                self._execute_d_type(device)
+            self._execute_shared(clock_ids, siggen_ids)
+            for device in gates:
+                self._execute_gate(device)
+            if self.steady_state:
+                return True
+        return False
+
+    def record_signals(self):
+        """Record the packed signal level of every monitor.
+
+        This function is called at every simulation cycle, once the signals
+        have settled.
+        """
+        for device_id, output_id in self.monitors.monitors_dictionary:
+            output = (device_id, output_id)
+            self.packed_traces.setdefault(output, []).append(
+                self.level[output])
+
+    def get_trace(self, device_id, output_id, scenario):
+        """Return the signal trace of a monitor in the specified scenario.
+
+        Return None if the monitor has not been recorded or the scenario
+        does not exist.
+        """
+        output = (device_id, output_id)
+        if output not in self.packed_traces:
+            return None
+        if scenario not in range(self.count):
+            return None
+        return [(word >> scenario) & 1 for word in self.packed_traces[output]]
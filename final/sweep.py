@@ -0,0 +1,120 @@
+"""Sweep switch assignments of a network over a pool of processes.
+
+Used in the Logic Simulator project for exhaustive or randomised testing of a
+definition file. The file is parsed once, and every switch assignment is
+simulated from the same starting state in a worker process.
+
+Classes
+-------
+Sweep - runs switch assignments of a network in worker processes.
+"""
+import concurrent.futures
+import itertools
+import os
+import pickle
+import random
+
+_netlist = None  # pickled netlist of this worker process
+
+
+def _init_worker(netlist):
+    """Store the pickled netlist sent to this worker process."""
+    global _netlist
+    _netlist = netlist
+
+
+def _run_assignment(assignment, cycles):
+    """Simulate one switch assignment from a fresh copy of the netlist.
+
+    Return the monitor traces as {(device_id, output_id): bytes}, with one
+    byte per signal, or None if the network oscillates.
+    """
+    [names, devices, network, monitors] = pickle.loads(_netlist)
+    for device_id, signal in assignment.items():
+        devices.set_switch(device_id, signal)
+    for _ in range(cycles):
+        if not network.execute_network():
+            return None
+        monitors.record_signals()
+    return {monitor: bytes(signal_list) for monitor, signal_list
+            in monitors.monitors_dictionary.items()}
+
+
+class Sweep:
+    """Run switch assignments of a network in a pool of worker processes.
+
+    The network is pickled once, after its schedule has been compiled, and
+    sent to every worker. Each switch assignment is then simulated for the
+    given number of cycles from a fresh copy of the network, so every
+    assignment starts from the same state, and its monitor traces are sent
+    back packed into bytes.
+
+    Parameters
+    ----------
+    names: instance of the names.Names() class.
+    devices: instance of the devices.Devices() class.
+    network: instance of the network.Network() class.
+    monitors: instance of the monitors.Monitors() class.
+    workers: maximum number of worker processes, or None for one per
+             processor.
+
+    Public methods
+    --------------
+    exhaustive_assignments(self): Returns every assignment of the switches.
+
+    random_assignments(self, count, seed=None): Returns count random
+                                                assignments of the switches.
+
+    run(self, assignments, cycles): Simulates every assignment for the given
+                                    number of cycles and yields the results.
+    """
+
+    def __init__(self, names, devices, network, monitors, workers=None):
+        """Pickle the network to be sent to the workers."""
+        self.names = names
+        self.devices = devices
+        self.network = network
+        self.monitors = monitors
+        self.workers = workers
+
+        self.switch_ids = self.devices.find_devices(self.devices.SWITCH)
+        self.network.get_schedule()  # compile once, rather than per worker
+        self.netlist = pickle.dumps([names, devices, network, monitors])
+
+    def exhaustive_assignments(self):
+        """Return every assignment of the switches.
+
+        Each assignment is a dictionary of {switch_id: signal}.
+        """
+        signals = [self.devices.LOW, self.devices.HIGH]
+        return [dict(zip(self.switch_ids, switch_states)) for switch_states
+                in itertools.product(signals, repeat=len(self.switch_ids))]
+
+    def random_assignments(self, count, seed=None):
+        """Return count random assignments of the switches."""
+        generator = random.Random(seed)
+        signals = [self.devices.LOW, self.devices.HIGH]
+        return [{switch_id: generator.choice(signals)
+                 for switch_id in self.switch_ids} for _ in range(count)]
+
+    def run(self, assignments, cycles):
+        """Simulate every assignment for the given number of cycles.
+
+        Yield (assignment, traces) in the order of assignments as the
+        results arrive, where traces is {(device_id, output_id): bytes}, or
+        None if the network oscillates.
+        """
+        assignments = list(assignments)
+        if not assignments:
+            return
+        # Send the assignments in chunks to keep the messages few
+        workers = self.workers or os.cpu_count() or 1
+        chunksize = max(1, len(assignments) // (4 * workers))
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker,
+                initargs=(self.netlist,)) as executor:
+            results = executor.map(_run_assignment, assignments,
+                                   itertools.repeat(cycles),
+                                   chunksize=chunksize)
+            for assignment, traces in zip(assignments, results):
+                yield (assignment, traces)
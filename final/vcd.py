@@ -0,0 +1,118 @@
+"""Write monitored signals to a Value Change Dump file.
+
+Used in the Logic Simulator project to export signal traces to external
+waveform viewers. The signals are streamed to the file as they are recorded,
+so the traces do not need to be kept in memory.
+
+Classes
+-------
+VcdWriter - streams the changes in the monitored signals to a VCD file.
+"""
+
+
+class VcdWriter:
+    """Stream the changes in the monitored signals to a VCD file.
+
+    The writer is added to the monitors with Monitors.add_writer(), and is
+    then given the monitored signals every time they are recorded. Only the
+    signals that have changed since the previous cycle are written, and they
+    are buffered and written to the file in chunks. Each simulation cycle is
+    one time unit. The header is written at the first cycle, so monitors
+    made after that are not written.
+
+    Parameters
+    ----------
+    names: instance of the names.Names() class.
+    devices: instance of the devices.Devices() class.
+    vcd_file: file object opened for writing text.
+    chunk_size: number of lines buffered before they are written.
+
+    Public methods
+    --------------
+    write_signals(self, signals): Writes the changes in the signals of one
+                                  simulation cycle.
+
+    flush(self): Writes the buffered lines to the file.
+
+    close(self): Writes the end time and the buffered lines to the file.
+    """
+
+    def __init__(self, names, devices, vcd_file, chunk_size=4096):
+        """Initialise the buffer and the VCD identifier codes."""
+        self.names = names
+        self.devices = devices
+        self.vcd_file = vcd_file
+        self.chunk_size = chunk_size
+
+        self.buffer = []  # lines not yet written to the file
+        self.cycle = 0  # simulation cycle of the next signals
+        # codes stores {(device_id, output_id): VCD identifier code}
+        self.codes = {}
+        # values stores {(device_id, output_id): last value written}
+        self.values = {}
+
+        self.value_characters = {self.devices.LOW: "0",
+                                 self.devices.HIGH: "1",
+                                 self.devices.RISING: "1",
+                                 self.devices.FALLING: "0",
+                                 self.devices.BLANK: "x"}
+
+    def _make_code(self, index):
+        """Return the VCD identifier code of the index-th signal.
+
+        The codes are written in base 94, using the printable ASCII
+        characters from "!" to "~".
+        """
+        code = ""
+        while True:
+            code += chr(ord("!") + index % 94)
+            index //= 94
+            if index == 0:
+                return code
+
+    def _write_header(self, signals):
+        """Write the declarations of the monitored signals."""
+        self.buffer.extend(["$timescale 1 ns $end\n",
+                            "$scope module logsim $end\n"])
+        for index, (monitor, signal) in enumerate(signals):
+            self.codes[monitor] = self._make_code(index)
+            signal_name = self.devices.get_signal_name(*monitor)
+            self.buffer.append("$var wire 1 " + self.codes[monitor] + " "
+                               + signal_name + " $end\n")
+        self.buffer.extend(["$upscope $end\n", "$enddefinitions $end\n"])
+
+    def write_signals(self, signals):
+        """Write the changes in the signals of one simulation cycle.
+
+        signals is a list of ((device_id, output_id), signal) pairs, as
+        given by Monitors.record_signals().
+        """
+        if self.cycle == 0:
+            self._write_header(signals)
+        changes = []
+        for monitor, signal in signals:
+            if monitor not in self.codes:  # made after the header
+                continue
+            value = self.value_characters.get(signal, "x")
+            if self.values.get(monitor) != value:
+                self.values[monitor] = value
+                changes.append(value + self.codes[monitor] + "\n")
+        if changes:
+            self.buffer.append("#" + str(self.cycle) + "\n")
+            self.buffer.extend(changes)
+        self.cycle += 1
+        if len(self.buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered lines to the file."""
+        self.vcd_file.write("".join(self.buffer))
+        self.buffer = []
+
+    def close(self):
+        """Write the end time and the buffered lines to the file.
+
+        The file itself is left open.
+        """
+        self.buffer.append("#" + str(self.cycle) + "\n")
+        self.flush()
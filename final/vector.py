@@ -0,0 +1,178 @@
+"""Execute the network with vectorised NumPy gate evaluation.
+
+Used in the Logic Simulator project as an alternative simulation engine for
+large networks. The gates are compiled into NumPy arrays and each group of
+gates of the same kind and number of inputs is evaluated in one operation.
+
+Classes
+-------
+VectorEngine - compiles the network into arrays and executes it.
+"""
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed by this engine
+    np = None
+
+
+class VectorEngine:
+    """Compile the network into arrays and execute it.
+
+    The state of the network is held in a signal vector with one entry per
+    device output. The gates of each level of the levelized schedule are
+    grouped by kind and number of inputs, and every group is evaluated as a
+    vectorised reduction over a matrix of input indices. The switches,
+    clocks, siggens and D-types are still executed by the network, so their
+    RISING and FALLING edges follow Network.update_signal exactly, and the
+    gate outputs are written back to the devices after every cycle.
+
+    Parameters
+    ----------
+    names: instance of the names.Names() class.
+    devices: instance of the devices.Devices() class.
+    network: instance of the network.Network() class.
+
+    Public methods
+    --------------
+    compile(self): Compiles the network into signal and index arrays.
+
+    execute_network(self): Executes all the devices in the network for one
+                           simulation cycle.
+    """
+
+    def __init__(self, names, devices, network):
+        """Check that NumPy is available and initialise the arrays."""
+        if np is None:
+            raise ImportError("The vector engine requires NumPy.")
+        self.names = names
+        self.devices = devices
+        self.network = network
+
+        self.schedule = None  # schedule the arrays were compiled from
+        self.signals = None  # signal vector, one entry per device output
+        self.slots = {}  # {(device_id, output_id): index into signals}
+        self.source_slots = []  # [(slot, device, output_id)] of non-gates
+        self.gate_slots = None  # signal vector indices of the gate outputs
+        self.gate_devices = []  # devices in the order of gate_slots
+
+        # steps stores, in evaluation order, either
+        # (device_kind, input index matrix, output indices) for a group of
+        # gates, or (component, driver slots) for a feedback component
+        self.steps = []
+
+    def compile(self):
+        """Compile the network into signal and index arrays.
+
+        Return False if the network cannot be levelized.
+        """
+        schedule = self.network.get_schedule()
+        self.schedule = schedule
+        if schedule is None:
+            return False
+
+        self.slots = {}
+        self.source_slots = []
+        gate_slots = []
+        self.gate_devices = []
+        for device in self.devices.devices_list:
+            for output_id in device.outputs:
+                slot = len(self.slots)
+                self.slots[(device.device_id, output_id)] = slot
+                if device.device_kind in self.network.gate_rules:
+                    gate_slots.append(slot)
+                    self.gate_devices.append(device)
+                else:
+                    self.source_slots.append((slot, device, output_id))
+        self.signals = np.zeros(len(self.slots), dtype=np.int8)
+        for device in self.devices.devices_list:
+            for output_id, signal in device.outputs.items():
+                self.signals[self.slots[(device.device_id, output_id)]] = \
+                    signal
+        self.gate_slots = np.array(gate_slots, dtype=np.intp)
+
+        self.steps = []
+        for level in schedule:
+            groups = {}  # {(device_kind, no_of_inputs): [device, ...]}
+            for component, is_feedback in level:
+                if is_feedback:
+                    self.steps.append(self._feedback_step(component))
+                    continue
+                device = self.devices.get_device(component[0])
+                key = (device.device_kind, len(device.inputs))
+                groups.setdefault(key, []).append(device)
+            for (device_kind, no_of_inputs), group in groups.items():
+                inputs = np.array(
+                    [[self.slots[connected_output]
+                      for connected_output in device.inputs.values()]
+                     for device in group], dtype=np.intp)
+                outputs = np.array(
+                    [self.slots[(device.device_id, None)] for device in group],
+                    dtype=np.intp)
+                self.steps.append((device_kind, inputs, outputs))
+        return True
+
+    def _feedback_step(self, component):
+        """Return the step that settles a feedback component."""
+        driver_slots = []
+        for device_id in component:
+            device = self.devices.get_device(device_id)
+            for connected_output in device.inputs.values():
+                if connected_output[0] not in component:
+                    driver_slots.append(
+                        (self.slots[connected_output], connected_output))
+        return (component, driver_slots)
+
+    def _evaluate_group(self, device_kind, inputs, outputs):
+        """Set the outputs of a group of gates from their input signals."""
+        input_signals = self.signals[inputs]
+        if device_kind == self.devices.XOR:
+            result = input_signals[:, 0] != input_signals[:, 1]
+            self.signals[outputs] = np.where(result, self.devices.HIGH,
+                                             self.devices.LOW)
+        else:
+            (x, y) = self.network.gate_rules[device_kind]
+            all_x = (input_signals == x).all(axis=1)
+            self.signals[outputs] = np.where(all_x, y,
+                                             self.network.invert_signal(y))
+
+    def _settle_feedback(self, component, driver_slots):
+        """Settle a feedback component with the network's own gates.
+
+        Return True if the component settles.
+        """
+        get_device = self.devices.devices_dictionary.get
+        for slot, (device_id, output_id) in driver_slots:
+            get_device(device_id).outputs[output_id] = int(self.signals[slot])
+        if not self.network._settle_devices(component):
+            return False
+        for device_id in component:
+            self.signals[self.slots[(device_id, None)]] = \
+                get_device(device_id).outputs[None]
+        return True
+
+    def execute_network(self):
+        """Execute all the devices in the network for one simulation cycle.
+
+        Return True if successful and the network does not oscillate.
+        """
+        if self.network.get_schedule() is not self.schedule:
+            self.compile()
+        if self.schedule is None:  # needs iterating to find the clock edges
+            return self.network._execute_iterative()
+        if not self.network._execute_sequential():
+            return False
+
+        for slot, device, output_id in self.source_slots:
+            self.signals[slot] = device.outputs[output_id]
+        previous = self.signals[self.gate_slots]
+        for step in self.steps:
+            if len(step) == 3:
+                self._evaluate_group(*step)
+            elif not self._settle_feedback(*step):
+                return False
+
+        # Write the changed gate outputs back to the devices
+        current = self.signals[self.gate_slots]
+        for index in np.flatnonzero(current != previous):
+            self.gate_devices[index].outputs[None] = int(current[index])
+        self.network.steady_state = True
+        return True
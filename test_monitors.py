@@ -1,10 +1,13 @@
 """Test the monitors module."""
+from array import array
+
 import pytest
 
 from final.names import Names
 from final.network import Network
 from final.devices import Devices
-from final.monitors import Monitors
+from final.monitors import Monitors, RunLengthTrace, RingTrace, \
+    MappedTrace
 
 
 @pytest.fixture
@@ -39,9 +42,9 @@ def test_make_monitor(new_monitors):
     names = new_monitors.names
     [SW1_ID, SW2_ID, OR1_ID] = names.lookup(["Sw1", "Sw2", "Or1"])
 
-    assert new_monitors.monitors_dictionary == {("Sw1", None): [],
-                                                ("Sw2", None): [],
-                                                ("Or1", None): []}
+    assert new_monitors.monitors_dictionary == {("Sw1", None): array("b"),
+                                                ("Sw2", None): array("b"),
+                                                ("Or1", None): array("b")}
 
 
 def test_make_monitor_gives_errors(new_monitors):
@@ -72,8 +75,8 @@ def test_remove_monitor(new_monitors):
     [SW1_ID, SW2_ID, OR1_ID] = names.lookup(["Sw1", "Sw2", "Or1"])
 
     new_monitors.remove_monitor("Sw1", None)
-    assert new_monitors.monitors_dictionary == {("Sw2", None): [],
-                                                ("Or1", None): []}
+    assert new_monitors.monitors_dictionary == {("Sw2", None): array("b"),
+                                                ("Or1", None): array("b")}
 
 
 def test_get_signal_names(new_monitors):
@@ -115,9 +118,9 @@ def test_record_signals(new_monitors):
     new_monitors.record_signals()
 
     assert new_monitors.monitors_dictionary == {
-        ("Sw1", None): [LOW, HIGH, HIGH],
-        ("Sw2", None): [LOW, LOW, HIGH],
-        ("Or1", None): [LOW, HIGH, HIGH]}
+        ("Sw1", None): array("b", [LOW, HIGH, HIGH]),
+        ("Sw2", None): array("b", [LOW, LOW, HIGH]),
+        ("Or1", None): array("b", [LOW, HIGH, HIGH])}
 
 
 def test_get_margin(new_monitors):
@@ -145,13 +148,14 @@ def test_reset_monitors(new_monitors):
     LOW = devices.LOW
     new_monitors.record_signals()
     new_monitors.record_signals()
-    assert new_monitors.monitors_dictionary == {("Sw1", None): [LOW, LOW],
-                                                ("Sw2", None): [LOW, LOW],
-                                                ("Or1", None): [LOW, LOW]}
+    assert new_monitors.monitors_dictionary == {
+        ("Sw1", None): array("b", [LOW, LOW]),
+        ("Sw2", None): array("b", [LOW, LOW]),
+        ("Or1", None): array("b", [LOW, LOW])}
     new_monitors.reset_monitors()
-    assert new_monitors.monitors_dictionary == {("Sw1", None): [],
-                                                ("Sw2", None): [],
-                                                ("Or1", None): []}
+    assert new_monitors.monitors_dictionary == {("Sw1", None): array("b"),
+                                                ("Sw2", None): array("b"),
+                                                ("Or1", None): array("b")}
 
 
 def test_display_signals(capsys, new_monitors):
@@ -197,3 +201,185 @@ def test_display_signals(capsys, new_monitors):
             "Clock1: -__--__--__--__--__-" in traces)
 
     assert "" in traces  # additional empty line at the end
+
+
+def test_get_trace(new_monitors):
+    """Test if get_trace returns a view of the trace without copying it."""
+    devices = new_monitors.devices
+    [SW3_ID] = devices.names.lookup(["Sw3"])
+    LOW = devices.LOW
+    BLANK = devices.BLANK
+
+    new_monitors.record_signals()
+    new_monitors.record_signals()
+    devices.make_device("Sw3", devices.SWITCH, 1)
+    new_monitors.make_monitor("Sw3", None, cycles_completed=2)
+
+    trace = new_monitors.get_trace("Sw1", None)
+    assert trace.readonly
+    assert trace.itemsize == 1
+    assert trace.tolist() == [LOW, LOW]
+    assert new_monitors.get_trace("Sw3", None).tolist() == [BLANK, BLANK]
+    assert new_monitors.get_trace("Sw4", None) is None
+
+    # The view shares the memory of the trace
+    new_monitors.monitors_dictionary[("Sw1", None)][0] = BLANK
+    assert trace[0] == BLANK
+
+
+def test_run_length_trace():
+    """Test if RunLengthTrace stores runs and is indexed by cycle."""
+    trace = RunLengthTrace([4, 4, 0])
+    for signal in [0, 0, 1, 1, 1, 0]:
+        trace.append(signal)
+
+    assert list(trace.runs()) == [(4, 2), (0, 3), (1, 3), (0, 1)]
+    assert len(trace) == 9
+    assert [trace[cycle] for cycle in range(9)] == [4, 4, 0, 0, 0, 1, 1, 1, 0]
+    assert trace[-1] == 0
+    assert trace == [4, 4, 0, 0, 0, 1, 1, 1, 0]
+    assert trace != [4, 4, 0]
+    with pytest.raises(IndexError):
+        trace[9]
+
+
+def test_run_length_monitors(capsys, new_monitors):
+    """Test if run-length traces record and display the same signals."""
+    names = new_monitors.names
+    devices = new_monitors.devices
+    network = new_monitors.network
+    run_length_monitors = Monitors(names, devices, network, run_length=True)
+    for device_id in ["Sw1", "Sw2", "Or1"]:
+        run_length_monitors.make_monitor(device_id, None)
+
+    for cycle in range(20):
+        if cycle == 10:
+            devices.set_switch("Sw1", devices.HIGH)
+        network.execute_network()
+        new_monitors.record_signals()
+        run_length_monitors.record_signals()
+
+    assert run_length_monitors.monitors_dictionary == \
+        new_monitors.monitors_dictionary
+    trace = run_length_monitors.monitors_dictionary[("Or1", None)]
+    assert list(trace.runs()) == [(devices.LOW, 10), (devices.HIGH, 10)]
+    assert list(run_length_monitors.get_runs("Or1", None)) == \
+        list(new_monitors.get_runs("Or1", None))
+    assert run_length_monitors.get_trace("Or1", None).tolist() == \
+        new_monitors.get_trace("Or1", None).tolist()
+
+    new_monitors.display_signals()
+    array_output = capsys.readouterr().out
+    run_length_monitors.display_signals()
+    assert capsys.readouterr().out == array_output
+
+    run_length_monitors.reset_monitors()
+    assert run_length_monitors.monitors_dictionary[("Or1", None)] == []
+
+
+def test_ring_trace():
+    """Test if RingTrace keeps only the most recent signals."""
+    trace = RingTrace(4, [4, 0])
+    assert list(trace) == [4, 0]
+    assert trace.first_cycle == 0
+
+    trace.extend([1, 1, 0, 1])
+    assert len(trace) == 4
+    assert list(trace) == [1, 1, 0, 1]
+    assert [trace[index] for index in range(4)] == [1, 1, 0, 1]
+    assert trace[-2] == 0
+    assert trace.first_cycle == 2
+    assert trace == [1, 1, 0, 1]
+    with pytest.raises(IndexError):
+        trace[4]
+
+
+def test_history_monitors(capsys, new_monitors):
+    """Test if a history window keeps and displays the last cycles only."""
+    names = new_monitors.names
+    devices = new_monitors.devices
+    network = new_monitors.network
+    history_monitors = Monitors(names, devices, network, history=5)
+    history_monitors.make_monitor("Sw1", None)
+
+    for cycle in range(12):
+        if cycle == 9:
+            devices.set_switch("Sw1", devices.HIGH)
+        network.execute_network()
+        history_monitors.record_signals()
+    devices.make_device("Sw3", devices.SWITCH, 1)
+    history_monitors.make_monitor("Sw3", None, cycles_completed=12)
+
+    assert history_monitors.monitors_dictionary[("Sw1", None)] == \
+        [devices.LOW, devices.LOW, devices.HIGH, devices.HIGH, devices.HIGH]
+    assert history_monitors.get_first_cycle("Sw1", None) == 7
+    assert history_monitors.get_first_cycle("Sw3", None) == 7
+    assert new_monitors.get_first_cycle("Sw1", None) == 0
+    assert history_monitors.get_first_cycle("Sw4", None) is None
+
+    history_monitors.display_signals()
+    traces = capsys.readouterr().out.split("\n")
+    assert "Sw1: __---" in traces
+    assert "Sw3:      " in traces
+
+    history_monitors.reset_monitors()
+    assert history_monitors.get_first_cycle("Sw1", None) == 0
+    assert history_monitors.monitors_dictionary[("Sw1", None)] == []
+
+
+def test_mapped_trace(tmp_path):
+    """Test if MappedTrace writes full chunks to its memory-mapped file."""
+    signal_list = [0, 1, 1, 0, 4, 1, 0, 0, 1, 1]
+    trace = MappedTrace(tmp_path, chunk_size=4)
+    trace.extend(signal_list[:5])
+    assert trace.stored == 4
+    assert list(trace.chunk) == [4]
+    assert trace[2] == 1
+    trace.extend(signal_list[5:])
+
+    assert len(trace) == 10
+    assert trace.stored == 8
+    assert [trace[index] for index in range(10)] == signal_list
+    assert trace[-3] == 0
+    assert list(trace) == signal_list
+    assert trace == signal_list
+    assert list(trace[3:9]) == signal_list[3:9]
+    assert list(trace[6:]) == signal_list[6:]
+    assert list(trace[::3]) == signal_list[::3]
+    with pytest.raises(IndexError):
+        trace[10]
+
+    trace.close()
+    assert trace.trace_file.closed
+
+
+def test_mapped_monitors(capsys, tmp_path, new_monitors):
+    """Test if memory-mapped traces record and display the same signals."""
+    names = new_monitors.names
+    devices = new_monitors.devices
+    network = new_monitors.network
+    mapped_monitors = Monitors(names, devices, network,
+                               trace_directory=tmp_path)
+    for device_id in ["Sw1", "Sw2", "Or1"]:
+        mapped_monitors.make_monitor(device_id, None)
+
+    for cycle in range(20):
+        if cycle == 10:
+            devices.set_switch("Sw1", devices.HIGH)
+        network.execute_network()
+        new_monitors.record_signals()
+        mapped_monitors.record_signals()
+
+    trace = mapped_monitors.monitors_dictionary[("Or1", None)]
+    assert isinstance(trace, MappedTrace)
+    assert mapped_monitors.monitors_dictionary == \
+        new_monitors.monitors_dictionary
+    assert list(mapped_monitors.get_runs("Or1", None, 8, 12)) == \
+        [(devices.LOW, 2), (devices.HIGH, 2)]
+    assert list(new_monitors.get_runs("Or1", None, 8, 12)) == \
+        [(devices.LOW, 2), (devices.HIGH, 2)]
+
+    new_monitors.display_signals()
+    array_output = capsys.readouterr().out
+    mapped_monitors.display_signals()
+    assert capsys.readouterr().out == array_output
@@ -365,3 +365,102 @@ def test_oscillating_network(new_network):
     network.make_connection(SW4_ID, None, NOR1, I2)
 
     assert not network.execute_network()
+
+
+def test_levelize(network_with_devices):
+    """Test if levelize orders gates after the gates driving them."""
+    network = network_with_devices
+    devices = network.devices
+    names = devices.names
+
+    [SW1_ID, SW2_ID, OR1_ID, AND1_ID, NOR1_ID, I1, I2] = names.lookup(
+        ["Sw1", "Sw2", "Or1", "And1", "Nor1", "I1", "I2"])
+    devices.make_device(AND1_ID, devices.AND, 2)
+    devices.make_device(NOR1_ID, devices.NOR, 2)
+
+    network.make_connection(SW1_ID, None, OR1_ID, I1)
+    network.make_connection(SW2_ID, None, OR1_ID, I2)
+    network.make_connection(OR1_ID, None, AND1_ID, I1)
+    network.make_connection(SW1_ID, None, AND1_ID, I2)
+    # Nor1 feeds back into itself
+    network.make_connection(AND1_ID, None, NOR1_ID, I1)
+    network.make_connection(NOR1_ID, None, NOR1_ID, I2)
+
+    assert network.levelize() == [[([OR1_ID], False)],
+                                  [([AND1_ID], False)],
+                                  [([NOR1_ID], True)]]
+
+    # A new connection makes the stored schedule stale
+    devices.make_device("D1", devices.D_TYPE)
+    assert network.schedule is not None
+    network.make_connection(OR1_ID, None, "D1", devices.CLK_ID)
+    assert network.schedule is None
+
+    # D-types clocked by a gate cannot be levelized
+    assert network.get_schedule() is None
+
+
+def test_build_fanout(network_with_devices):
+    """Test if build_fanout lists the devices driven by each output."""
+    network = network_with_devices
+    devices = network.devices
+    names = devices.names
+
+    [SW1_ID, SW2_ID, OR1_ID, AND1_ID, I1, I2] = names.lookup(
+        ["Sw1", "Sw2", "Or1", "And1", "I1", "I2"])
+    devices.make_device(AND1_ID, devices.AND, 2)
+
+    network.make_connection(SW1_ID, None, OR1_ID, I1)
+    network.make_connection(SW1_ID, None, OR1_ID, I2)
+    network.make_connection(SW1_ID, None, AND1_ID, I1)
+    network.make_connection(OR1_ID, None, AND1_ID, I2)
+
+    assert network.build_fanout() == {(SW1_ID, None): [OR1_ID, AND1_ID],
+                                      (SW2_ID, None): [],
+                                      (OR1_ID, None): [AND1_ID],
+                                      (AND1_ID, None): []}
+
+
+@pytest.mark.parametrize("engine", ["LEVELIZED", "EVENT_DRIVEN"])
+def test_engines_match_iterative(engine):
+    """Test if the other engines give the same signals as iterating."""
+    traces = []
+    for engine_name in ["ITERATIVE", engine]:
+        names = Names()
+        devices = Devices(names)
+        network = Network(names, devices)
+        network.engine = getattr(network, engine_name)
+        [I1, I2] = names.lookup(["I1", "I2"])
+
+        devices.make_device("Sw1", devices.SWITCH, 1)
+        devices.make_device("Sw2", devices.SWITCH, 0)
+        devices.make_device("Clk", devices.CLOCK, 2)
+        devices.make_device("D1", devices.D_TYPE)
+        devices.make_device("Xor1", devices.XOR)
+        devices.make_device("Nand1", devices.NAND, 2)
+        # Start the clock and D-type from a known state
+        devices.get_device("Clk").clock_counter = 0
+        devices.get_device("Clk").outputs[None] = devices.LOW
+        devices.get_device("D1").dtype_memory = devices.LOW
+
+        network.make_connection("Xor1", None, "D1", devices.DATA_ID)
+        network.make_connection("Clk", None, "D1", devices.CLK_ID)
+        network.make_connection("Sw2", None, "D1", devices.SET_ID)
+        network.make_connection("Sw2", None, "D1", devices.CLEAR_ID)
+        network.make_connection("D1", devices.QBAR_ID, "Nand1", I1)
+        network.make_connection("Sw1", None, "Nand1", I2)
+        network.make_connection("Nand1", None, "Xor1", I1)
+        network.make_connection("Clk", None, "Xor1", I2)
+
+        trace = []
+        for cycle in range(24):
+            if cycle == 10:
+                devices.set_switch("Sw1", devices.LOW)
+            if cycle == 17:
+                devices.set_switch("Sw1", devices.HIGH)
+            assert network.execute_network()
+            trace.append([network.get_output_signal("D1", devices.Q_ID),
+                          network.get_output_signal("Xor1", None)])
+        traces.append(trace)
+
+    assert traces[0] == traces[1]
@@ -7,6 +7,7 @@ It validates:
 raises the expected exception.
 """
 import pytest
+import io
 import os
 
 from final.names import Names
@@ -48,6 +49,23 @@ def test_valid_file_is_accepted(parser_factory, capsys):
     assert "File parsed successfully" in output
 
 
+def test_streamed_file_is_accepted(capsys):
+    """Test that a network description read from a stream is parsed."""
+    names = Names()
+    devices = Devices(names)
+    network = Network(names, devices)
+    monitors = Monitors(names, devices, network)
+    base_dir = os.path.dirname(os.path.dirname(__file__))
+    file_path = os.path.join(base_dir, "GF2/test_files", "valid.txt")
+    with open(file_path) as file:
+        stream = io.StringIO(file.read())
+    scanner = Scanner(stream, names, chunk_size=5)
+    parser = Parser(names, devices, network, monitors, scanner)
+    isParsed, output = _run_and_capture(parser, capsys)
+    assert isParsed is True
+    assert devices.find_devices()
+
+
 # Define the error cases with their expected messages
 ERROR_CASES: dict[str, str] = {
     # Syntax / format errors
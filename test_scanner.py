@@ -2,6 +2,7 @@
 import pytest
 from final.scanner import Scanner, Symbol
 from final.names import Names
+import io
 import os
 
 
@@ -81,3 +82,44 @@ def test_whitespace(new_scanner):
     scanner = new_scanner("whitespace")
     symbol = scanner.get_symbol()
     assert symbol.type == 2
+
+
+@pytest.mark.parametrize("file_name", sorted(
+    os.path.splitext(file_name)[0] for file_name
+    in os.listdir(os.path.join(os.path.dirname(__file__), "test_files"))))
+def test_fast_tokenizer(file_name):
+    """The regex tokenizer should return the same symbols as the loops"""
+    base_dir = os.path.dirname(os.path.dirname(__file__))
+    file_path = os.path.join(base_dir, "GF2/test_files", file_name + ".txt")
+    symbol_lists = []
+    for fast in [True, False]:
+        scanner = Scanner(file_path, Names(), fast=fast)
+        symbols = []
+        # Files ending in a string scan it forever, so stop after a while
+        while len(symbols) < 1000:
+            symbol = scanner.get_symbol()
+            symbols.append((symbol.type, symbol.id))
+            if symbol.type == scanner.EOF:
+                break
+        symbol_lists.append(symbols)
+    assert symbol_lists[0] == symbol_lists[1]
+
+
+def test_stream():
+    """Reading a file object in small chunks should give the same symbols"""
+    base_dir = os.path.dirname(os.path.dirname(__file__))
+    file_path = os.path.join(base_dir, "GF2/test_files", "valid.txt")
+    with open(file_path) as file:
+        stream = io.StringIO(file.read())
+    symbol_lists = []
+    for scanner in [Scanner(file_path, Names()),
+                    Scanner(stream, Names(), chunk_size=3)]:
+        symbols = []
+        symbol = scanner.get_symbol()
+        while symbol.type != scanner.EOF:
+            symbols.append((symbol.type, symbol.id))
+            symbol = scanner.get_symbol()
+        symbol_lists.append(symbols)
+    assert symbol_lists[0] == symbol_lists[1]
+    assert len(scanner.contents) < 6  # only the last chunks are kept
+    assert not stream.closed  # the caller's stream is left open
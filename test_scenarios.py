@@ -0,0 +1,161 @@
+"""Test the scenarios module."""
+import pytest
+
+from final.names import Names
+from final.devices import Devices
+from final.network import Network
+from final.monitors import Monitors
+from final.scenarios import Scenarios
+
+
+@pytest.fixture
+def new_scenarios():
+    """Return a Scenarios instance for gates of each kind, with 4 scenarios.
+
+    Every gate is driven by the two switches Sw1 and Sw2, and every gate
+    output is monitored.
+    """
+    new_names = Names()
+    new_devices = Devices(new_names)
+    new_network = Network(new_names, new_devices)
+    new_monitors = Monitors(new_names, new_devices, new_network)
+    [I1, I2] = new_names.lookup(["I1", "I2"])
+
+    new_devices.make_device("Sw1", new_devices.SWITCH, 0)
+    new_devices.make_device("Sw2", new_devices.SWITCH, 0)
+    for gate_id, gate_kind in [("And1", new_devices.AND),
+                               ("Or1", new_devices.OR),
+                               ("Nand1", new_devices.NAND),
+                               ("Nor1", new_devices.NOR),
+                               ("Xor1", new_devices.XOR)]:
+        if gate_kind == new_devices.XOR:
+            new_devices.make_device(gate_id, gate_kind)
+        else:
+            new_devices.make_device(gate_id, gate_kind, 2)
+        new_network.make_connection("Sw1", None, gate_id, I1)
+        new_network.make_connection("Sw2", None, gate_id, I2)
+        new_monitors.make_monitor(gate_id, None)
+
+    return Scenarios(new_names, new_devices, new_network, new_monitors, 4)
+
+
+def test_set_switch(new_scenarios):
+    """Test if set_switch sets one bit of the switch word."""
+    devices = new_scenarios.devices
+
+    assert new_scenarios.set_switch("Sw1", 2, devices.HIGH)
+    assert new_scenarios.switch_words["Sw1"] == 0b0100
+    assert new_scenarios.set_switch("Sw1", 0, devices.HIGH)
+    assert new_scenarios.set_switch("Sw1", 2, devices.LOW)
+    assert new_scenarios.switch_words["Sw1"] == 0b0001
+
+    assert not new_scenarios.set_switch("And1", 0, devices.HIGH)
+    assert not new_scenarios.set_switch("Sw3", 0, devices.HIGH)
+    assert not new_scenarios.set_switch("Sw1", 4, devices.HIGH)
+    assert not new_scenarios.set_switch("Sw1", 0, devices.RISING)
+
+
+def test_execute_gates(new_scenarios):
+    """Test if one pass gives the gate outputs of every scenario."""
+    devices = new_scenarios.devices
+    switch_states = [[0, 0], [0, 1], [1, 0], [1, 1]]
+    gate_outputs = [[0, 0, 1, 1, 0],
+                    [0, 1, 1, 0, 1],
+                    [0, 1, 1, 0, 1],
+                    [1, 1, 0, 0, 0]]
+
+    for scenario, [sw1_state, sw2_state] in enumerate(switch_states):
+        new_scenarios.set_switch("Sw1", scenario, sw1_state)
+        new_scenarios.set_switch("Sw2", scenario, sw2_state)
+    assert new_scenarios.execute_network()
+    new_scenarios.record_signals()
+
+    for scenario in range(4):
+        assert [new_scenarios.get_trace(gate_id, None, scenario) for gate_id
+                in ["And1", "Or1", "Nand1", "Nor1", "Xor1"]] == \
+            [[signal] for signal in gate_outputs[scenario]]
+
+    # The switches of the network itself are not changed
+    assert devices.get_device("Sw1").switch_state == devices.LOW
+    assert new_scenarios.get_trace("Sw1", None, 0) is None
+    assert new_scenarios.get_trace("And1", None, 4) is None
+
+
+def test_oscillating_network(new_scenarios):
+    """Test if execute_network returns False if any scenario oscillates."""
+    devices = new_scenarios.devices
+    network = new_scenarios.network
+    [I1, I2] = devices.names.lookup(["I1", "I2"])
+
+    # Nor2 oscillates while Sw1 is LOW
+    devices.make_device("Nor2", devices.NOR, 2)
+    network.make_connection("Nor2", None, "Nor2", I1)
+    network.make_connection("Sw1", None, "Nor2", I2)
+    new_scenarios.reset()
+    for scenario in range(4):
+        new_scenarios.set_switch("Sw1", scenario, devices.HIGH)
+    assert new_scenarios.execute_network()
+
+    new_scenarios.set_switch("Sw1", 3, devices.LOW)
+    assert not new_scenarios.execute_network()
+
+
+@pytest.mark.parametrize("engine", ["ITERATIVE", "LEVELIZED"])
+def test_scenarios_match_network(engine):
+    """Test if every scenario gives the same traces as the network."""
+    toggle_cycles = [[], [10, 17], [3], [3, 4, 5, 20]]
+    traces = []
+    for scenario in range(len(toggle_cycles) + 1):
+        names = Names()
+        devices = Devices(names)
+        network = Network(names, devices)
+        monitors = Monitors(names, devices, network)
+        network.engine = getattr(network, engine)
+        [I1, I2] = names.lookup(["I1", "I2"])
+
+        devices.make_device("Sw1", devices.SWITCH, 1)
+        devices.make_device("Sw2", devices.SWITCH, 0)
+        devices.make_device("Clk", devices.CLOCK, 2)
+        devices.make_device("D1", devices.D_TYPE)
+        devices.make_device("Xor1", devices.XOR)
+        devices.make_device("Nand1", devices.NAND, 2)
+        # Start the clock and D-type from a known state
+        devices.get_device("Clk").clock_counter = 0
+        devices.get_device("Clk").outputs[None] = devices.LOW
+        devices.get_device("D1").dtype_memory = devices.LOW
+
+        network.make_connection("Xor1", None, "D1", devices.DATA_ID)
+        network.make_connection("Clk", None, "D1", devices.CLK_ID)
+        network.make_connection("Sw2", None, "D1", devices.SET_ID)
+        network.make_connection("Sw2", None, "D1", devices.CLEAR_ID)
+        network.make_connection("D1", devices.QBAR_ID, "Nand1", I1)
+        network.make_connection("Sw1", None, "Nand1", I2)
+        network.make_connection("Nand1", None, "Xor1", I1)
+        network.make_connection("Clk", None, "Xor1", I2)
+        monitors.make_monitor("D1", devices.Q_ID)
+        monitors.make_monitor("Xor1", None)
+
+        if scenario == len(toggle_cycles):  # run all the scenarios at once
+            scenarios = Scenarios(names, devices, network, monitors,
+                                  len(toggle_cycles))
+            sw1_word = scenarios.switch_words["Sw1"]
+            for cycle in range(24):
+                for index, cycles in enumerate(toggle_cycles):
+                    if cycle in cycles:
+                        sw1_word ^= 1 << index
+                scenarios.switch_words["Sw1"] = sw1_word
+                assert scenarios.execute_network()
+                scenarios.record_signals()
+            for index in range(len(toggle_cycles)):
+                assert monitors.load_scenario(scenarios, index)
+                assert traces[index] == dict(monitors.monitors_dictionary)
+            assert not monitors.load_scenario(scenarios, len(toggle_cycles))
+        else:
+            sw1_state = devices.HIGH
+            for cycle in range(24):
+                if cycle in toggle_cycles[scenario]:
+                    sw1_state = network.invert_signal(sw1_state)
+                    devices.set_switch("Sw1", sw1_state)
+                assert network.execute_network()
+                monitors.record_signals()
+            traces.append(dict(monitors.monitors_dictionary))
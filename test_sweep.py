@@ -0,0 +1,97 @@
+"""Test the sweep module."""
+import pytest
+
+from final.names import Names
+from final.devices import Devices
+from final.network import Network
+from final.monitors import Monitors
+from final.sweep import Sweep
+
+
+@pytest.fixture
+def new_sweep():
+    """Return a Sweep of a network with two switches, a clock and a D-type.
+
+    The D-type samples Xor1 = Sw1 XOR Sw2 on every rising clock edge.
+    """
+    new_names = Names()
+    new_devices = Devices(new_names)
+    new_network = Network(new_names, new_devices)
+    new_monitors = Monitors(new_names, new_devices, new_network)
+    [I1, I2] = new_names.lookup(["I1", "I2"])
+
+    new_devices.make_device("Sw1", new_devices.SWITCH, 0)
+    new_devices.make_device("Sw2", new_devices.SWITCH, 0)
+    new_devices.make_device("Zero", new_devices.SWITCH, 0)
+    new_devices.make_device("Clk", new_devices.CLOCK, 1)
+    new_devices.make_device("Xor1", new_devices.XOR)
+    new_devices.make_device("D1", new_devices.D_TYPE)
+    new_network.make_connection("Sw1", None, "Xor1", I1)
+    new_network.make_connection("Sw2", None, "Xor1", I2)
+    new_network.make_connection("Xor1", None, "D1", new_devices.DATA_ID)
+    new_network.make_connection("Clk", None, "D1", new_devices.CLK_ID)
+    new_network.make_connection("Zero", None, "D1", new_devices.SET_ID)
+    new_network.make_connection("Zero", None, "D1", new_devices.CLEAR_ID)
+    new_monitors.make_monitor("Xor1", None)
+    new_monitors.make_monitor("D1", new_devices.Q_ID)
+
+    return Sweep(new_names, new_devices, new_network, new_monitors, 2)
+
+
+def test_assignments(new_sweep):
+    """Test if the exhaustive and random assignments cover the switches."""
+    assignments = new_sweep.exhaustive_assignments()
+    assert len(assignments) == 8
+    assert assignments[0] == {"Sw1": 0, "Sw2": 0, "Zero": 0}
+    assert assignments[5] == {"Sw1": 1, "Sw2": 0, "Zero": 1}
+
+    random_assignments = new_sweep.random_assignments(5, seed=1)
+    assert random_assignments == new_sweep.random_assignments(5, seed=1)
+    assert len(random_assignments) == 5
+    assert all(assignment in assignments
+               for assignment in random_assignments)
+
+
+def test_run(new_sweep):
+    """Test if every assignment gives the traces of a sequential run."""
+    devices = new_sweep.devices
+    network = new_sweep.network
+    monitors = new_sweep.monitors
+    assignments = new_sweep.exhaustive_assignments()
+
+    results = list(new_sweep.run(assignments, 6))
+    assert [assignment for assignment, traces in results] == assignments
+
+    for assignment, traces in results:
+        xor_trace = [assignment["Sw1"] ^ assignment["Sw2"]] * 6
+        assert list(traces[("Xor1", None)]) == xor_trace
+
+    # The sweep leaves the network unchanged, so it can be run here too
+    for device_id, signal in assignments[6].items():
+        devices.set_switch(device_id, signal)
+    for _ in range(6):
+        assert network.execute_network()
+        monitors.record_signals()
+    assert {monitor: bytes(signal_list) for monitor, signal_list
+            in monitors.monitors_dictionary.items()} == results[6][1]
+
+    assert list(new_sweep.run([], 6)) == []
+
+
+def test_run_oscillating(new_sweep):
+    """Test if the traces are None when the network oscillates."""
+    names = new_sweep.names
+    devices = new_sweep.devices
+    network = new_sweep.network
+    monitors = new_sweep.monitors
+    [I1, I2] = names.lookup(["I1", "I2"])
+
+    # Nor1 oscillates while Sw1 is LOW
+    devices.make_device("Nor1", devices.NOR, 2)
+    network.make_connection("Nor1", None, "Nor1", I1)
+    network.make_connection("Sw1", None, "Nor1", I2)
+    sweep = Sweep(names, devices, network, monitors, 2)
+
+    results = list(sweep.run([{"Sw1": 0}, {"Sw1": 1}], 3))
+    assert results[0] == ({"Sw1": 0}, None)
+    assert results[1][1] is not None
@@ -0,0 +1,94 @@
+"""Test the vcd module."""
+import io
+
+import pytest
+
+from final.names import Names
+from final.devices import Devices
+from final.network import Network
+from final.monitors import Monitors
+from final.vcd import VcdWriter
+
+
+@pytest.fixture
+def new_monitors():
+    """Return a Monitors instance with monitors on a switch and a NOT gate."""
+    new_names = Names()
+    new_devices = Devices(new_names)
+    new_network = Network(new_names, new_devices)
+    new_monitors = Monitors(new_names, new_devices, new_network)
+    [I1] = new_names.lookup(["I1"])
+
+    new_devices.make_device("Sw1", new_devices.SWITCH, 0)
+    new_devices.make_device("Nand1", new_devices.NAND, 1)
+    new_network.make_connection("Sw1", None, "Nand1", I1)
+    new_monitors.make_monitor("Sw1", None)
+    new_monitors.make_monitor("Nand1", None)
+
+    return new_monitors
+
+
+def run_cycles(monitors, switch_states):
+    """Run one cycle with each of the switch states and record the signals."""
+    for switch_state in switch_states:
+        monitors.devices.set_switch("Sw1", switch_state)
+        assert monitors.network.execute_network()
+        monitors.record_signals()
+
+
+def test_write_signals(new_monitors):
+    """Test if only the changed signals are written for each cycle."""
+    vcd_file = io.StringIO()
+    writer = VcdWriter(new_monitors.names, new_monitors.devices, vcd_file)
+    new_monitors.add_writer(writer)
+
+    run_cycles(new_monitors, [0, 0, 1, 1, 1, 0])
+    assert vcd_file.getvalue() == ""  # still buffered
+    writer.close()
+
+    assert vcd_file.getvalue().split("\n") == [
+        "$timescale 1 ns $end",
+        "$scope module logsim $end",
+        "$var wire 1 ! Sw1 $end",
+        '$var wire 1 " Nand1 $end',
+        "$upscope $end",
+        "$enddefinitions $end",
+        "#0", "0!", '1"',
+        "#2", "1!", '0"',
+        "#5", "0!", '1"',
+        "#6", ""]
+
+    # The traces are still recorded as well
+    assert list(new_monitors.monitors_dictionary[("Sw1", None)]) == \
+        [0, 0, 1, 1, 1, 0]
+
+
+def test_chunks(new_monitors):
+    """Test if the buffered lines are written in chunks."""
+    vcd_file = io.StringIO()
+    writer = VcdWriter(new_monitors.names, new_monitors.devices, vcd_file,
+                       chunk_size=15)
+    new_monitors.add_writer(writer)
+
+    run_cycles(new_monitors, [0, 1])
+    assert vcd_file.getvalue() == ""
+    run_cycles(new_monitors, [0])  # the buffer reaches 15 lines
+    assert vcd_file.getvalue().endswith('#2\n0!\n1"\n')
+    assert writer.buffer == []
+
+    assert new_monitors.remove_writer(writer)
+    assert not new_monitors.remove_writer(writer)
+    run_cycles(new_monitors, [1])
+    writer.close()
+    assert vcd_file.getvalue().endswith('1"\n#3\n')
+
+
+def test_identifier_codes(new_monitors):
+    """Test if every signal is given a different identifier code."""
+    writer = VcdWriter(new_monitors.names, new_monitors.devices,
+                       io.StringIO())
+    codes = [writer._make_code(index) for index in range(94 * 94 + 1)]
+    assert codes[:3] == ["!", '"', "#"]
+    assert codes[93] == "~"
+    assert codes[94] == '!"'
+    assert len(set(codes)) == len(codes)
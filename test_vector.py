@@ -0,0 +1,94 @@
+"""Test the vector module."""
+import pytest
+
+from final.names import Names
+from final.devices import Devices
+from final.network import Network
+
+pytest.importorskip("numpy")
+from final.vector import VectorEngine  # noqa: E402
+
+
+@pytest.fixture
+def vector_network():
+    """Return a Network executed by a VectorEngine, with gates of each kind.
+
+    Every gate is driven by the two switches Sw1 and Sw2.
+    """
+    new_names = Names()
+    new_devices = Devices(new_names)
+    new_network = Network(new_names, new_devices)
+    [I1, I2] = new_names.lookup(["I1", "I2"])
+
+    new_devices.make_device("Sw1", new_devices.SWITCH, 0)
+    new_devices.make_device("Sw2", new_devices.SWITCH, 0)
+    for gate_id, gate_kind in [("And1", new_devices.AND),
+                               ("Or1", new_devices.OR),
+                               ("Nand1", new_devices.NAND),
+                               ("Nor1", new_devices.NOR),
+                               ("Xor1", new_devices.XOR)]:
+        if gate_kind == new_devices.XOR:
+            new_devices.make_device(gate_id, gate_kind)
+        else:
+            new_devices.make_device(gate_id, gate_kind, 2)
+        new_network.make_connection("Sw1", None, gate_id, I1)
+        new_network.make_connection("Sw2", None, gate_id, I2)
+
+    new_network.engine = VectorEngine(new_names, new_devices, new_network)
+    return new_network
+
+
+@pytest.mark.parametrize("switch_states, gate_outputs", [
+    ([0, 0], [0, 0, 1, 1, 0]),
+    ([0, 1], [0, 1, 1, 0, 1]),
+    ([1, 0], [0, 1, 1, 0, 1]),
+    ([1, 1], [1, 1, 0, 0, 0]),
+])
+def test_execute_gates(vector_network, switch_states, gate_outputs):
+    """Test if the vector engine gives the correct gate outputs."""
+    network = vector_network
+    devices = network.devices
+
+    devices.set_switch("Sw1", switch_states[0])
+    devices.set_switch("Sw2", switch_states[1])
+    assert network.execute_network()
+
+    # The outputs are written back to the devices
+    assert [network.get_output_signal(gate_id, None) for gate_id in
+            ["And1", "Or1", "Nand1", "Nor1", "Xor1"]] == gate_outputs
+
+
+def test_compile(vector_network):
+    """Test if compile groups the gates by kind and number of inputs."""
+    network = vector_network
+    devices = network.devices
+    engine = network.engine
+
+    assert engine.compile()
+    assert len(engine.signals) == 7
+    assert len(engine.steps) == 5
+    for device_kind, inputs, outputs in engine.steps:
+        assert inputs.shape == (1, 2)
+        assert list(engine.signals[inputs[0]]) == [devices.LOW, devices.LOW]
+
+    # A new gate with four inputs is compiled into its own group
+    [I1, I2, I3, I4] = devices.names.lookup(["I1", "I2", "I3", "I4"])
+    devices.make_device("And2", devices.AND, 4)
+    for input_id in [I1, I2, I3, I4]:
+        network.make_connection("Sw1", None, "And2", input_id)
+    assert network.execute_network()
+    assert (1, 4) in [inputs.shape for device_kind, inputs, outputs
+                      in engine.steps]
+
+
+def test_oscillating_network(vector_network):
+    """Test if the vector engine returns False for oscillating networks."""
+    network = vector_network
+    devices = network.devices
+    [I1, I2] = devices.names.lookup(["I1", "I2"])
+
+    devices.make_device("Nor2", devices.NOR, 2)
+    network.make_connection("Nor2", None, "Nor2", I1)
+    network.make_connection("Sw1", None, "Nor2", I2)
+
+    assert not network.execute_network()